@@ -1,17 +1,13 @@
 """CLI commands for APK analysis."""
 
-import json
 from collections.abc import Callable, Sequence
 from pathlib import Path
 
 import typer
-from rich.table import Table
 
-from batuta.core.analyzer import FrameworkDetector
-from batuta.core.manifest import ManifestParser, get_sdk_label
 from batuta.exceptions import BatutaError
 from batuta.models.manifest import ComponentInfo, ProviderInfo
-from batuta.utils.output import console
+from batuta.utils.output import console, emit_json_bytes
 
 app = typer.Typer(no_args_is_help=True)
 
@@ -45,6 +41,8 @@ def detect_framework(
     Accepts a single APK file or a split APK directory — all parts are
     scanned together so frameworks detected via split libs/assets are found.
     """
+    from batuta.core.analyzer import FrameworkDetector
+
     console.set_json_mode(json_output)
 
     try:
@@ -60,9 +58,7 @@ def detect_framework(
         result = detector.detect(include_native_libs=not no_native_libs)
 
         if json_output:
-            # Serialize Path to string for JSON output
-            output = result.model_dump(mode="json")
-            typer.echo(json.dumps(output, indent=2))
+            emit_json_bytes(result.model_dump_json(indent=2).encode())
             return
 
         if len(paths) > 1:
@@ -71,18 +67,18 @@ def detect_framework(
         # Table/rich output
         if result.detected_frameworks:
             console.print("\n[bold]Frameworks Detected:[/bold]")
+            lines: list[str] = []
             for fw in result.detected_frameworks:
-                console.print(f"  [cyan]{fw.name}[/cyan]")
-                for matched in fw.matched_files:
-                    console.print(f"    - {matched}")
+                lines.append(f"  [cyan]{fw.name}[/cyan]")
+                lines.extend(f"    - {matched}" for matched in fw.matched_files)
+            console.print("\n".join(lines))
         else:
             console.print_warning("No frameworks detected.")
 
         if result.native_libraries:
             lib_count = len(result.native_libraries)
             console.print(f"\n[bold]Native Libraries ({lib_count} files):[/bold]")
-            for lib in result.native_libraries:
-                console.print(f"  {lib}")
+            console.print("\n".join(f"  {lib}" for lib in result.native_libraries))
 
         console.print()
 
@@ -145,6 +141,10 @@ def analyze_manifest(
     general info and attack surface summary. Use component flags to see
     detailed analysis of activities, services, receivers, and providers.
     """
+    from rich.table import Table
+
+    from batuta.core.manifest import ManifestParser, get_sdk_label
+
     console.set_json_mode(json_output)
 
     try:
@@ -152,8 +152,7 @@ def analyze_manifest(
         result = parser.parse()
 
         if json_output:
-            output = result.model_dump(mode="json")
-            typer.echo(json.dumps(output, indent=2))
+            emit_json_bytes(result.model_dump_json(indent=2).encode())
             return
 
         if all_components:
@@ -202,15 +201,13 @@ def analyze_manifest(
             console.print(
                 f"\n[bold]Declared Permissions[/bold]  ({len(info.permissions)})"
             )
-            for perm in info.permissions:
-                console.print(f"  {perm}")
+            console.print("\n".join(f"  {perm}" for perm in info.permissions))
 
         if info.uses_permissions:
             console.print(
                 f"\n[bold]Requested Permissions[/bold]  ({len(info.uses_permissions)})"
             )
-            for perm in info.uses_permissions:
-                console.print(f"  {perm}")
+            console.print("\n".join(f"  {perm}" for perm in info.uses_permissions))
 
         # Attack Surface Summary
         surface = result.attack_surface
@@ -307,6 +304,8 @@ def _print_component_table(
     extra_columns: list[tuple[str, Callable[[ComponentInfo], str]]] | None = None,
 ) -> None:
     """Print a table for a component type."""
+    from rich.table import Table
+
     if not components:
         console.print(f"\n[bold]{title}[/bold]")
         console.print("  None declared")
@@ -358,6 +357,8 @@ def _print_component_table(
 
 def _print_provider_table(providers: list[ProviderInfo]) -> None:
     """Print content providers with additional details."""
+    from rich.table import Table
+
     if not providers:
         console.print("\n[bold]Content Providers[/bold]")
         console.print("  None declared")
@@ -413,5 +414,6 @@ def _print_provider_table(providers: list[ProviderInfo]) -> None:
     for provider in providers:
         if provider.grant_uri_permission_paths:
             console.print(f"\n  [yellow]Grant URI paths for {provider.name}:[/yellow]")
-            for path in provider.grant_uri_permission_paths:
-                console.print(f"    {path}")
+            console.print(
+                "\n".join(f"    {path}" for path in provider.grant_uri_permission_paths)
+            )
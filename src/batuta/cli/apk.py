@@ -1,16 +1,13 @@
 """CLI commands for APK management."""
 
-import json
-from contextlib import nullcontext
+import itertools
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import typer
-from rich.table import Table
+from pydantic import TypeAdapter
 
-from batuta.core.adb import ADBWrapper
-from batuta.core.analyzer import FrameworkDetector
-from batuta.core.decompiler import APKDecompiler
-from batuta.core.merger import SplitAPKMerger
 from batuta.exceptions import (
     APKPermissionError,
     BatutaError,
@@ -19,13 +16,29 @@ from batuta.exceptions import (
 )
 from batuta.models.apk import DecompileResult, PackageInfo
 from batuta.utils.deps import require
-from batuta.utils.output import console
+from batuta.utils.output import console, emit_json, emit_json_bytes
 
 app = typer.Typer(no_args_is_help=True)
 
+# Default concurrent adb pulls (--jobs) while earlier APKs are merged/decompiled
+PULL_WORKERS = 3
+
+# Above this many rows, package listings skip the Rich table layout
+TABLE_ROW_LIMIT = 500
+
+# Interactive selection syntax ("1,3-5,7") and its individual tokens
+_SELECTION_RE = re.compile(r"\d+(?:-\d+)?(?:,\d+(?:-\d+)?)*")
+_SELECTION_TOKEN_RE = re.compile(r"(\d+)(?:-(\d+))?")
+
+# Serializers built once at import and shared by all JSON output paths
+_PACKAGE_ADAPTER = TypeAdapter(PackageInfo)
+_PACKAGE_LIST_ADAPTER = TypeAdapter(list[PackageInfo])
+
 
 def _display_package_table(packages: list[PackageInfo], query: str) -> None:
     """Display a table of packages for selection."""
+    from rich.table import Table
+
     console.print(f"\n[yellow]Multiple packages match '{query}':[/yellow]\n")
 
     table = Table()
@@ -39,6 +52,58 @@ def _display_package_table(packages: list[PackageInfo], query: str) -> None:
     console.print()
 
 
+def _print_package_list(
+    packages: list[PackageInfo], title: str, detailed: bool
+) -> None:
+    """Print packages as a table, or as plain rows when output is piped.
+
+    Piped output skips Rich layout entirely and is written as tab-separated
+    rows, so large listings stream out instead of being rendered up front.
+    Listings longer than TABLE_ROW_LIMIT are printed as padded columns.
+    """
+    # Columns are formatted once up front, then zipped into rows
+    columns = [[pkg.package_name for pkg in packages]]
+    if detailed:
+        columns.append([pkg.version_name or "-" for pkg in packages])
+        columns.append(["Yes" if pkg.split_apks else "No" for pkg in packages])
+
+    if not console.is_terminal:
+        console.write_lines("\t".join(row) for row in zip(*columns, strict=True))
+        return
+
+    if len(packages) > TABLE_ROW_LIMIT:
+        # Bulk listing: pad columns to their widest cell instead of laying out
+        # thousands of Rich table rows
+        headers = ["Package Name", "Version", "Split"][: len(columns)]
+        widths = [
+            max(len(header), *map(len, column))
+            for header, column in zip(headers, columns, strict=True)
+        ]
+        rows = itertools.chain([headers], zip(*columns, strict=True))
+        console.print(f"[italic]{title}[/italic]")
+        console.write_lines(
+            "  ".join(
+                cell.ljust(width) for cell, width in zip(row, widths, strict=True)
+            ).rstrip()
+            for row in rows
+        )
+        return
+
+    from rich.table import Table
+
+    table = Table(title=title)
+    table.add_column("Package Name", style="cyan")
+
+    if detailed:
+        table.add_column("Version")
+        table.add_column("Split")
+
+    for row in zip(*columns, strict=True):
+        table.add_row(*row)
+
+    console.print(table)
+
+
 def _parse_selection(choice: str, max_idx: int) -> list[int] | None:
     """Parse user selection input.
 
@@ -56,32 +121,30 @@ def _parse_selection(choice: str, max_idx: int) -> list[int] | None:
     if choice in ("a", "all"):
         return list(range(max_idx))
 
-    indices: set[int] = set()
-    parts = choice.replace(" ", "").split(",")
-
-    for part in parts:
-        if "-" in part:
-            # Range: "1-5"
-            try:
-                start, end = part.split("-", 1)
-                start_idx = int(start) - 1
-                end_idx = int(end) - 1
-                if start_idx < 0 or end_idx >= max_idx or start_idx > end_idx:
-                    return None
-                indices.update(range(start_idx, end_idx + 1))
-            except ValueError:
-                return None
-        else:
-            # Single number
-            try:
-                idx = int(part) - 1
-                if idx < 0 or idx >= max_idx:
-                    return None
-                indices.add(idx)
-            except ValueError:
-                return None
-
-    return sorted(indices) if indices else None
+    choice = choice.replace(" ", "")
+    if not _SELECTION_RE.fullmatch(choice):
+        return None
+
+    # Ascending, non-overlapping tokens ("1,3-5,7") are emitted directly in
+    # order. Otherwise selected 0-based indices are accumulated as bits, so a
+    # range costs one shift regardless of its width, and decoded at the end.
+    ordered: list[int] = []
+    in_order = True
+    mask = 0
+    for match in _SELECTION_TOKEN_RE.finditer(choice):
+        start_idx = int(match.group(1)) - 1
+        end_idx = int(match.group(2) or match.group(1)) - 1
+        if start_idx < 0 or end_idx >= max_idx or start_idx > end_idx:
+            return None
+        if in_order and ordered and start_idx <= ordered[-1]:
+            in_order = False
+        if in_order:
+            ordered.extend(range(start_idx, end_idx + 1))
+        mask |= ((1 << (end_idx - start_idx + 1)) - 1) << start_idx
+
+    if in_order:
+        return ordered
+    return [i for i in range(max_idx) if mask >> i & 1]
 
 
 def _select_package(
@@ -99,32 +162,31 @@ def _select_package(
     """
     _display_package_table(packages, query)
 
-    if multiple:
-        prompt_msg = "Select packages (e.g., 1,3-5 or 'a' for all, 'q' to quit)"
-    else:
-        prompt_msg = "Select package number (or 'q' to quit)"
-
+    if not multiple:
+        # Typer converts and re-prompts on non-numeric input itself
+        invalid_msg = f"Invalid choice. Enter 1-{len(packages)}"
+        while True:
+            idx = typer.prompt("Select package number (or 0 to quit)", type=int)
+            if idx == 0:
+                raise typer.Abort()
+            if 1 <= idx <= len(packages):
+                return [packages[idx - 1]]
+            console.print_error(invalid_msg)
+
+    prompt_msg = "Select packages (e.g., 1,3-5 or 'a' for all, 'q' to quit)"
+    invalid_msg = (
+        f"Invalid selection. Enter 1-{len(packages)}, ranges (1-3), "
+        "comma-separated (1,3,5), or 'a' for all"
+    )
     while True:
         choice = typer.prompt(prompt_msg)
         if choice.lower() == "q":
             raise typer.Abort()
 
-        if multiple:
-            indices = _parse_selection(choice, len(packages))
-            if indices is not None:
-                return [packages[i] for i in indices]
-            console.print_error(
-                f"Invalid selection. Enter 1-{len(packages)}, ranges (1-3), "
-                "comma-separated (1,3,5), or 'a' for all"
-            )
-        else:
-            try:
-                idx = int(choice) - 1
-                if 0 <= idx < len(packages):
-                    return [packages[idx]]
-                console.print_error(f"Invalid choice. Enter 1-{len(packages)}")
-            except ValueError:
-                console.print_error("Please enter a number")
+        indices = _parse_selection(choice, len(packages))
+        if indices is not None:
+            return [packages[i] for i in indices]
+        console.print_error(invalid_msg)
 
 
 @app.command("list")
@@ -158,11 +220,13 @@ def list_packages(
     ),
 ) -> None:
     """List installed packages on device."""
+    from batuta.core.adb import get_adb
+
     require("adb")
     console.set_json_mode(json_output)
 
     try:
-        adb = ADBWrapper(device_id=device)
+        adb = get_adb(device)
 
         if filter_query:
             packages = adb.search_packages(
@@ -170,47 +234,26 @@ def list_packages(
                 include_system=system,
                 detailed=detailed,
             )
+        elif detailed:
+            # One batched dumpsys instead of a lookup per package
+            packages = adb.get_all_package_info(include_system=system)
         else:
-            if detailed:
-                # Get all package names then fetch details
-                pkg_names = adb.list_packages(include_system=system)
-                packages = []
-                for name in pkg_names:
-                    try:
-                        packages.append(adb.get_package_info(name))
-                    except Exception:
-                        packages.append(PackageInfo(package_name=name))
-            else:
-                pkg_names = adb.list_packages(include_system=system)
-                packages = [PackageInfo(package_name=name) for name in pkg_names]
+            pkg_names = adb.list_packages(include_system=system)
+            packages = [
+                PackageInfo.model_construct(package_name=name) for name in pkg_names
+            ]
 
         if json_output:
-            output = [pkg.model_dump(exclude_none=True) for pkg in packages]
-            typer.echo(json.dumps(output, indent=2))
+            emit_json_bytes(
+                _PACKAGE_LIST_ADAPTER.dump_json(packages, exclude_none=True, indent=2)
+            )
             return
 
         if not packages:
             console.print_warning("No packages found")
             raise typer.Exit(1) from None
 
-        table = Table(title=f"Installed Packages ({len(packages)})")
-        table.add_column("Package Name", style="cyan")
-
-        if detailed:
-            table.add_column("Version")
-            table.add_column("Split")
-
-            for pkg in packages:
-                table.add_row(
-                    pkg.package_name,
-                    pkg.version_name or "-",
-                    "Yes" if pkg.is_split else "No",
-                )
-        else:
-            for pkg in packages:
-                table.add_row(pkg.package_name)
-
-        console.print(table)
+        _print_package_list(packages, f"Installed Packages ({len(packages)})", detailed)
 
     except BatutaError as e:
         console.print_error(str(e))
@@ -243,26 +286,31 @@ def package_info(
     ),
 ) -> None:
     """Show detailed information about a package."""
+    from batuta.core.adb import get_adb
+
     require("adb")
     console.set_json_mode(json_output)
 
     try:
-        adb = ADBWrapper(device_id=device)
+        adb = get_adb(device)
 
-        try:
-            match = adb.find_package(query, include_system=system)
-        except MultiplePackagesFoundError:
-            if not json_output:
-                matches = adb.search_packages(query, include_system=system)
-                selected = _select_package(matches, query, multiple=False)
-                match = selected[0]
-            else:
-                raise
+        # Lookup and metadata share one `adb shell` process
+        with adb.shell_session():
+            try:
+                match = adb.find_package(query, include_system=system)
+            except MultiplePackagesFoundError as e:
+                if not json_output:
+                    selected = _select_package(e.matches, query, multiple=False)
+                    match = selected[0]
+                else:
+                    raise
 
-        pkg = adb.get_package_info(match.package_name)
+            pkg = adb.get_package_info(match.package_name)
 
         if json_output:
-            typer.echo(json.dumps(pkg.model_dump(exclude_none=True), indent=2))
+            emit_json_bytes(
+                _PACKAGE_ADAPTER.dump_json(pkg, exclude_none=True, indent=2)
+            )
             return
 
         console.print(f"\n[bold cyan]{pkg.package_name}[/bold cyan]\n")
@@ -280,8 +328,13 @@ def package_info(
             console.print(f"  APK Path:     {pkg.apk_path}")
         if pkg.is_split:
             console.print(f"  Split APKs:   {len(pkg.split_apks or [])} files")
-            for split in pkg.split_apks or []:
-                console.print(f"               - {Path(split).name}")
+            if pkg.split_apks:
+                console.print(
+                    "\n".join(
+                        f"               - {Path(split).name}"
+                        for split in pkg.split_apks
+                    )
+                )
 
         console.print()
 
@@ -339,6 +392,22 @@ def pull_apk(
         "--auto-merge/--no-auto-merge",
         help="Automatically merge split APK parts using APKEditor.",
     ),
+    jobs: int = typer.Option(
+        PULL_WORKERS,
+        "--jobs",
+        min=1,
+        help="Number of APKs to pull from the device concurrently.",
+    ),
+    reuse_cached: bool = typer.Option(
+        False,
+        "--reuse-cached",
+        help="Skip files already pulled whose MD5 matches the device copy.",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="With --decompile: bypass the shared decompile cache.",
+    ),
     json_output: bool = typer.Option(
         False,
         "--json",
@@ -358,6 +427,11 @@ def pull_apk(
     remains untouched). When --decompile is provided, split APKs are
     merged automatically so decompilation can proceed.
     """
+    from batuta.core.adb import get_adb
+    from batuta.core.analyzer import FrameworkDetector
+    from batuta.core.decompiler import APKDecompiler, DecompileCache
+    from batuta.core.merger import SplitAPKMerger
+
     require("adb")
 
     if (java_only or smali_only) and not decompile:
@@ -376,10 +450,12 @@ def pull_apk(
     console.set_json_mode(json_output)
 
     try:
-        adb = ADBWrapper(device_id=device)
+        adb = get_adb(device)
 
         # Determine which packages to pull (fast search, no metadata)
         if pull_all:
+            # List once; the search below is then filtered in memory
+            adb.prime_cache(include_system=system)
             matches = adb.search_packages(query, include_system=system)
             if not matches:
                 raise PackageNotFoundError(query)
@@ -388,10 +464,9 @@ def pull_apk(
             try:
                 match = adb.find_package(query, include_system=system)
                 package_names = [match.package_name]
-            except MultiplePackagesFoundError:
+            except MultiplePackagesFoundError as e:
                 if not json_output:
-                    matches = adb.search_packages(query, include_system=system)
-                    selected = _select_package(matches, query, multiple=True)
+                    selected = _select_package(e.matches, query, multiple=True)
                     package_names = [m.package_name for m in selected]
                 else:
                     raise
@@ -401,116 +476,139 @@ def pull_apk(
         fw_results = []
         apkeditor_checked = False
 
-        for package_name in package_names:
-            if not json_output:
-                console.print_info(f"Pulling {package_name}...")
+        # Pulls run in the background so the next APK downloads while the
+        # current one is merged/decompiled. Results are consumed in order,
+        # keeping all console output on this thread.
+        executor = ThreadPoolExecutor(max_workers=min(jobs, len(package_names)))
+        pulls = [
+            (
+                name,
+                executor.submit(
+                    adb.pull_apk,
+                    name,
+                    output_dir=output_dir,
+                    reuse_cached=reuse_cached,
+                ),
+            )
+            for name in package_names
+        ]
 
-            status_label = f"Pulling {package_name}"
-            try:
-                with console.status(status_label) if not json_output else nullcontext():
-                    result = adb.pull_apk(package_name, output_dir=output_dir)
-            except APKPermissionError as e:
-                console.print_warning(f"Skipped {package_name}: {e}")
-                continue
+        try:
+            for package_name, pull in pulls:
+                if not json_output:
+                    console.print_info(f"Pulling {package_name}...")
 
-            results.append(result)
+                status_label = f"Pulling {package_name}"
+                try:
+                    with console.status(status_label):
+                        result = pull.result()
+                except APKPermissionError as e:
+                    console.print_warning(f"Skipped {package_name}: {e}")
+                    continue
 
-            if not json_output:
-                console.print_success(f"Pulled to {result.local_path}")
-
-                if result.is_split and result.split_paths:
-                    console.print_info(f"  {len(result.split_paths)} APK files:")
-                    for p in result.split_paths:
-                        console.print(f"    - {p.name}")
-                    if not (auto_merge or decompile):
-                        console.print_info(
-                            f"  Merge later with: batuta apk merge {result.local_path}"
-                        )
+                results.append(result)
 
-            # Quick framework scan across all pulled APK parts (ZIP listing only)
-            scan_paths = result.split_paths or [result.local_path]
-            fw_result = None
-            try:
-                fw_result = FrameworkDetector(scan_paths).detect(
-                    include_native_libs=False
-                )
-                if fw_result.detected_frameworks and not json_output:
-                    names = ", ".join(m.name for m in fw_result.detected_frameworks)
-                    console.print_info(f"  Framework: {names}")
-            except BatutaError:
-                pass  # Non-fatal — pull already succeeded
-            fw_results.append(fw_result)
-
-            merge_attempted = False
-            if result.is_split and (auto_merge or decompile):
-                merge_attempted = True
-                merge_reason = (
-                    "auto-merge enabled" if auto_merge else "required for decompile"
-                )
                 if not json_output:
-                    console.print_info(f"  Merging split APKs ({merge_reason})...")
-
-                if not apkeditor_checked:
-                    require("APKEditor")
-                    apkeditor_checked = True
+                    console.print_success(f"Pulled to {result.local_path}")
 
+                    if result.is_split and result.split_paths:
+                        console.print_info(f"  {len(result.split_paths)} APK files:")
+                        console.print(
+                            "\n".join(f"    - {p.name}" for p in result.split_paths)
+                        )
+                        if not (auto_merge or decompile):
+                            console.print_info(
+                                "  Merge later with: "
+                                f"batuta apk merge {result.local_path}"
+                            )
+
+                # Quick framework scan across all pulled APK parts (ZIP listing only)
+                scan_paths = result.split_paths or [result.local_path]
+                fw_result = None
                 try:
-                    merger = SplitAPKMerger(result.local_path)
-                    merged_path = merger.merge()
-                    result.merged_path = merged_path
-                    if not json_output:
-                        console.print_success(f"  Merged APK: {merged_path}")
-                except BatutaError as merge_error:
-                    result.merged_path = None
+                    fw_result = FrameworkDetector(scan_paths).detect(
+                        include_native_libs=False
+                    )
+                    if fw_result.detected_frameworks and not json_output:
+                        names = ", ".join(m.name for m in fw_result.detected_frameworks)
+                        console.print_info(f"  Framework: {names}")
+                except BatutaError:
+                    pass  # Non-fatal — pull already succeeded
+                fw_results.append(fw_result)
+
+                merge_attempted = False
+                if result.is_split and (auto_merge or decompile):
+                    merge_attempted = True
+                    merge_reason = (
+                        "auto-merge enabled" if auto_merge else "required for decompile"
+                    )
                     if not json_output:
-                        console.print_error(f"  Merge failed: {merge_error}")
-                    if auto_merge:
-                        raise
+                        console.print_info(f"  Merging split APKs ({merge_reason})...")
 
-            if decompile:
-                target_apk = result.final_apk_path
-                if target_apk is None:
-                    if not json_output:
-                        message = (
-                            "  Skipping decompile: failed to merge split APK parts."
-                            if merge_attempted
-                            else "  Skipping decompile: no APK available."
-                        )
-                        console.print_warning(message)
-                    decompile_results.append(None)
-                    continue
+                    if not apkeditor_checked:
+                        require("APKEditor")
+                        apkeditor_checked = True
 
-                if not json_output:
-                    console.print_info(f"  Decompiling {target_apk.name}...")
+                    try:
+                        merger = SplitAPKMerger(result.local_path)
+                        merged_path = merger.merge()
+                        result.merged_path = merged_path
+                        if not json_output:
+                            console.print_success(f"  Merged APK: {merged_path}")
+                    except BatutaError as merge_error:
+                        result.merged_path = None
+                        if not json_output:
+                            console.print_error(f"  Merge failed: {merge_error}")
+                        if auto_merge:
+                            raise
+
+                if decompile:
+                    target_apk = result.final_apk_path
+                    if target_apk is None:
+                        if not json_output:
+                            message = (
+                                "  Skipping decompile: failed to merge split APK parts."
+                                if merge_attempted
+                                else "  Skipping decompile: no APK available."
+                            )
+                            console.print_warning(message)
+                        decompile_results.append(None)
+                        continue
 
-                decompiler = APKDecompiler(target_apk)
-                do_java = not smali_only
-                do_smali = not java_only
+                    if not json_output:
+                        console.print_info(f"  Decompiling {target_apk.name}...")
 
-                with (
-                    console.status("  Decompiling...")
-                    if not json_output
-                    else nullcontext()
-                ):
-                    dec_result = decompiler.decompile(java=do_java, smali=do_smali)
+                    decompiler = APKDecompiler(
+                        target_apk, cache=None if no_cache else DecompileCache()
+                    )
+                    do_java = not smali_only
+                    do_smali = not java_only
 
-                decompile_results.append(dec_result)
+                    with console.status("  Decompiling..."):
+                        dec_result = decompiler.decompile(java=do_java, smali=do_smali)
 
-                if not json_output:
-                    console.print_success(f"  Decompiled to {dec_result.output_dir}")
+                    decompile_results.append(dec_result)
+
+                    if not json_output:
+                        console.print_success(
+                            f"  Decompiled to {dec_result.output_dir}"
+                        )
+        finally:
+            executor.shutdown(cancel_futures=True)
 
         if json_output:
+            # Path values are left as-is: emit_json() stringifies them
             output_items = []
             for i, result in enumerate(results):
                 item: dict[str, object] = {
                     "package_name": result.package_name,
-                    "local_path": str(result.local_path),
+                    "local_path": result.local_path,
                     "is_split": result.is_split,
                 }
                 if result.split_paths:
-                    item["split_paths"] = [str(p) for p in result.split_paths]
+                    item["split_paths"] = result.split_paths
                 if result.merged_path:
-                    item["merged_path"] = str(result.merged_path)
+                    item["merged_path"] = result.merged_path
 
                 fw = fw_results[i] if i < len(fw_results) else None
                 if fw is not None and fw.detected_frameworks:
@@ -520,14 +618,14 @@ def pull_apk(
                     decompile_item = decompile_results[i]
                     if decompile_item is not None:
                         dec_data: dict[str, object] = {
-                            "output_dir": str(decompile_item.output_dir),
+                            "output_dir": decompile_item.output_dir,
                             "java_success": decompile_item.java_success,
                             "smali_success": decompile_item.smali_success,
                         }
                         if decompile_item.java_dir:
-                            dec_data["java_dir"] = str(decompile_item.java_dir)
+                            dec_data["java_dir"] = decompile_item.java_dir
                         if decompile_item.smali_dir:
-                            dec_data["smali_dir"] = str(decompile_item.smali_dir)
+                            dec_data["smali_dir"] = decompile_item.smali_dir
                         item["decompile"] = dec_data
                     else:
                         item["decompile"] = None  # Split APK, skipped
@@ -540,7 +638,7 @@ def pull_apk(
             else:
                 payload = output_items[0]
 
-            typer.echo(json.dumps(payload, indent=2))
+            emit_json(payload)
             return
 
     except BatutaError as e:
@@ -563,6 +661,11 @@ def merge_split_apks(
         "-o",
         help="Output APK path (default: <dir>.merged.apk).",
     ),
+    fast: bool = typer.Option(
+        False,
+        "--fast",
+        help="Merge ABI/density-only splits in-process, without APKEditor.",
+    ),
     json_output: bool = typer.Option(
         False,
         "--json",
@@ -570,9 +673,16 @@ def merge_split_apks(
         help="Output as JSON.",
     ),
 ) -> None:
-    """Merge split APK directories into a single APK using APKEditor."""
+    """Merge split APK directories into a single APK using APKEditor.
+
+    With --fast, splits without their own resource table are merged
+    in-process when the base manifest needs no rewriting; anything else
+    still falls back to APKEditor.
+    """
+    from batuta.core.merger import SplitAPKMerger
 
-    require("APKEditor")
+    if not fast:
+        require("APKEditor")
     console.set_json_mode(json_output)
 
     try:
@@ -581,15 +691,15 @@ def merge_split_apks(
         if not json_output:
             console.print_info(f"Merging split APKs from {split_dir}...")
 
-        with console.status("Merging...") if not json_output else nullcontext():
-            merged_path = merger.merge()
+        with console.status("Merging..."):
+            merged_path = merger.merge(fast=fast)
 
         if json_output:
             payload = {
                 "split_dir": str(split_dir),
                 "output_path": str(merged_path),
             }
-            typer.echo(json.dumps(payload, indent=2))
+            emit_json(payload)
             return
 
         console.print_success(f"Merged APK created: {merged_path}")
@@ -635,40 +745,28 @@ def search_packages(
     By default, searches package names only (fast).
     Use --detailed to fetch full package metadata (slower).
     """
+    from batuta.core.adb import get_adb
+
     require("adb")
     console.set_json_mode(json_output)
 
     try:
-        adb = ADBWrapper(device_id=device)
+        adb = get_adb(device)
         packages = adb.search_packages(query, include_system=system, detailed=detailed)
 
         if json_output:
-            output = [pkg.model_dump(exclude_none=True) for pkg in packages]
-            typer.echo(json.dumps(output, indent=2))
+            emit_json_bytes(
+                _PACKAGE_LIST_ADAPTER.dump_json(packages, exclude_none=True, indent=2)
+            )
             return
 
         if not packages:
             console.print_warning(f"No packages found matching '{query}'")
             raise typer.Exit(1) from None
 
-        table = Table(title=f"Packages matching '{query}' ({len(packages)})")
-        table.add_column("Package Name", style="cyan")
-
-        if detailed:
-            table.add_column("Version")
-            table.add_column("Split")
-
-            for pkg in packages:
-                table.add_row(
-                    pkg.package_name,
-                    pkg.version_name or "-",
-                    "Yes" if pkg.is_split else "No",
-                )
-        else:
-            for pkg in packages:
-                table.add_row(pkg.package_name)
-
-        console.print(table)
+        _print_package_list(
+            packages, f"Packages matching '{query}' ({len(packages)})", detailed
+        )
 
     except BatutaError as e:
         console.print_error(str(e))
@@ -780,7 +878,7 @@ def patch_apk(
             console.print_info(f"Patching {apktool_dir.name}...")
 
         # Run patch workflow
-        with console.status("Building APK...") if not json_output else nullcontext():
+        with console.status("Building APK..."):
             result = patcher.patch(
                 sign=not no_sign,
                 align=not no_align,
@@ -816,15 +914,10 @@ def patch_apk(
             if not json_output:
                 console.print_info("Installing to device...")
 
-            with console.status("Installing...") if not json_output else nullcontext():
-                # Use -r to replace existing app
-                from batuta.utils.process import run_tool
+            from batuta.core.adb import get_adb
 
-                cmd = ["adb"]
-                if device:
-                    cmd.extend(["-s", device])
-                cmd.extend(["install", "-r", str(result.output_path)])
-                run_tool(cmd, check=True)
+            with console.status("Installing..."):
+                get_adb(device).install_apk(result.output_path)
 
             if not json_output:
                 console.print_success("Installed successfully")
@@ -839,7 +932,7 @@ def patch_apk(
                 "keystore_generated": result.keystore_generated,
                 "installed": install,
             }
-            typer.echo(json.dumps(output_data, indent=2))
+            emit_json(output_data)
 
     except BatutaError as e:
         console.print_error(str(e))
@@ -871,6 +964,17 @@ def decompile_apk(
         "--smali-only",
         help="Only decompile to smali/resources (apktool).",
     ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        "-f",
+        help="Re-run decompilers even if the output is up to date or cached.",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Neither read nor populate the shared decompile cache.",
+    ),
     json_output: bool = typer.Option(
         False,
         "--json",
@@ -902,7 +1006,12 @@ def decompile_apk(
 
         # Custom output directory
         batuta apk decompile app.apk -o ./analysis/
+
+        # Decompile again even if ./app/ is up to date
+        batuta apk decompile app.apk --force
     """
+    from batuta.core.decompiler import APKDecompiler, DecompileCache
+
     console.set_json_mode(json_output)
 
     # Validate mutually exclusive options
@@ -921,7 +1030,9 @@ def decompile_apk(
         require("apktool")
 
     try:
-        decompiler = APKDecompiler(apk_path, output_dir)
+        decompiler = APKDecompiler(
+            apk_path, output_dir, cache=None if no_cache else DecompileCache()
+        )
 
         if not json_output:
             targets = []
@@ -931,8 +1042,8 @@ def decompile_apk(
                 targets.append("smali")
             console.print_info(f"Decompiling {apk_path.name} ({', '.join(targets)})...")
 
-        with console.status("Decompiling...") if not json_output else nullcontext():
-            result = decompiler.decompile(java=do_java, smali=do_smali)
+        with console.status("Decompiling..."):
+            result = decompiler.decompile(java=do_java, smali=do_smali, force=force)
 
         if json_output:
             output_data: dict[str, object] = {
@@ -945,7 +1056,7 @@ def decompile_apk(
                 output_data["java_dir"] = str(result.java_dir)
             if result.smali_dir:
                 output_data["smali_dir"] = str(result.smali_dir)
-            typer.echo(json.dumps(output_data, indent=2))
+            emit_json(output_data)
             return
 
         # Display results
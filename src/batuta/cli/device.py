@@ -1,15 +1,12 @@
 """CLI commands for device management."""
 
-import json
 import subprocess
 
 import typer
-from rich.table import Table
 
-from batuta.core.adb import ADBWrapper
 from batuta.exceptions import BatutaError
 from batuta.utils.deps import require
-from batuta.utils.output import console
+from batuta.utils.output import console, emit_json
 
 app = typer.Typer(no_args_is_help=True)
 
@@ -24,11 +21,13 @@ def list_devices(
     ),
 ) -> None:
     """List connected Android devices."""
+    from batuta.core.adb import get_adb
+
     require("adb")
     console.set_json_mode(json_output)
 
     try:
-        adb = ADBWrapper()
+        adb = get_adb()
         devices = adb.list_devices()
 
         if json_output:
@@ -49,13 +48,31 @@ def list_devices(
                 # Hope you don't judge me too much for this :D
                 for d in devices.devices
             ]
-            typer.echo(json.dumps(output, indent=2))
+            emit_json(output)
             return
 
         if not devices.devices:
             console.print_warning("No devices connected")
             raise typer.Exit(1) from None
 
+        if not console.is_terminal:
+            # Piped: plain tab-separated rows, no Rich layout
+            console.write_lines(
+                "\t".join(
+                    [
+                        device.transport_id or "-",
+                        device.id,
+                        device.state.value,
+                        device.model or "-",
+                        device.product or "-",
+                    ]
+                )
+                for device in devices.devices
+            )
+            return
+
+        from rich.table import Table
+
         table = Table(title="Connected Devices")
         table.add_column("TID")
         table.add_column("ID", style="cyan")
@@ -95,10 +112,12 @@ def shell(
     ),
 ) -> None:
     """Open ADB shell on a device or run a shell command."""
+    from batuta.core.adb import get_adb
+
     require("adb")
 
     try:
-        adb = ADBWrapper(device_id=device)
+        adb = get_adb(device)
         target = adb.ensure_device()
 
         cmd = ["adb", "-s", target.id, "shell"]
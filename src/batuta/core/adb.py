@@ -1,25 +1,172 @@
 """ADB wrapper for device and package management."""
 
 import contextlib
+import hashlib
+import posixpath
+import re
 import shutil
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Generator, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from batuta.exceptions import (
+    ADBError,
     APKPermissionError,
     APKPullError,
     DeviceNotFoundError,
     MultiplePackagesFoundError,
     PackageNotFoundError,
+    ProcessError,
 )
 from batuta.models.apk import PackageInfo, PulledAPK
 from batuta.models.device import Device, DeviceList, DeviceState
-from batuta.utils.process import run_tool
+from batuta.utils.process import ShellSession, run_tool, stream_tool
+
+# Upper bound on concurrent ``adb shell`` round-trips when fetching metadata
+MAX_INFO_WORKERS = 16
+
+# Upper bound on concurrent `adb pull` transfers for the parts of one split APK
+MAX_SPLIT_PULL_WORKERS = 4
+
+# One `dumpsys package packages` scan dumps every installed package, system
+# ones included, so it only beats a `dumpsys package <name>` per package when
+# at least this many are uncached and they are this share of all installed
+BATCH_INFO_THRESHOLD = 8
+BATCH_INFO_MIN_FRACTION = 0.25
+
+# How long (seconds) one `adb devices -l` listing is reused across wrappers
+DEVICES_CACHE_TTL = 0.5
+
+_devices_lock = threading.Lock()
+_devices_cache: tuple[float, DeviceList] | None = None
+
+# Keys of `dumpsys package` record lines read by _PackageRecord.feed()
+_RECORD_KEYS = frozenset(
+    {"codePath", "versionName", "apkSigningVersion", "versionCode", "splits"}
+)
+
+# Record header in `dumpsys package` output: "  Package [com.example] (1a2b):"
+_DUMPSYS_PACKAGE_RE = re.compile(r"\s+Package \[([^\]]+)\]")
+
+
+@dataclass(slots=True)
+class _PackageRecord:
+    """Metadata fields collected from one `dumpsys package` record."""
+
+    version_name: str | None = None
+    version_code: int | None = None
+    min_sdk: int | None = None
+    target_sdk: int | None = None
+    signing_version: int | None = None
+    splits: list[str] | None = None
+    code_path: str | None = None
+
+    @property
+    def complete(self) -> bool:
+        """Check if every version/SDK/signing field has been seen."""
+        return all(
+            [
+                self.version_name,
+                self.version_code is not None,
+                self.min_sdk is not None,
+                self.target_sdk is not None,
+                self.signing_version is not None,
+            ]
+        )
+
+    def apk_paths(self) -> tuple[str, list[str]] | None:
+        """Derive base and split APK paths from codePath and splits.
+
+        Only /data/app installs have a predictable layout (base.apk plus
+        split_<name>.apk next to it); returns None for anything else. Also
+        None when no splits= line was seen: older releases that already
+        support split APKs don't print one, so it can't mean "no splits".
+        """
+        code_path = self.code_path
+        if code_path is None or not code_path.startswith("/data/app/"):
+            return None
+        if code_path.endswith(".apk"):
+            return code_path, []
+        if self.splits is None:
+            return None
+
+        split_apks = [
+            f"{code_path}/split_{split}.apk" for split in self.splits if split != "base"
+        ]
+        return f"{code_path}/base.apk", split_apks
+
+    def feed(self, line: str) -> None:
+        """Update fields from one line of the record."""
+        # Cheapest rejection first: one substring check, then only the
+        # leading indentation is stripped to find the key
+        if "=" not in line:
+            return
+
+        key, _, value = line.lstrip().partition("=")
+        if key not in _RECORD_KEYS:
+            return
+        value = value.rstrip()
+
+        if key == "codePath":
+            self.code_path = value
+
+        elif key == "versionName":
+            self.version_name = value
+
+        elif key == "apkSigningVersion":
+            with contextlib.suppress(ValueError):
+                self.signing_version = int(value)
+
+        elif key == "versionCode":
+            # Format: versionCode=123 minSdk=21 targetSdk=34
+            version_code, _, rest = value.partition(" ")
+            with contextlib.suppress(ValueError):
+                self.version_code = int(version_code)
+            for part in rest.split():
+                name, _, number = part.partition("=")
+                with contextlib.suppress(ValueError):
+                    if name == "minSdk":
+                        self.min_sdk = int(number)
+                    elif name == "targetSdk":
+                        self.target_sdk = int(number)
+
+        elif key == "splits" and value.startswith("["):
+            # Format: splits=[base, config.arm64_v8a, config.en]
+            names = value.strip("[]")
+            self.splits = [n.strip() for n in names.split(",") if n.strip()]
 
 
 def _is_permission_error(exc: BaseException) -> bool:
     return "Permission denied" in str(exc)
 
 
+# adb client errors meaning the resolved device is no longer usable
+_DEVICE_GONE_MARKERS = (
+    "no devices/emulators found",
+    "device offline",
+    "device unauthorized",
+    "adb: device '",  # adb: device 'SERIAL' not found
+)
+
+
+def _is_device_gone(exc: ProcessError) -> bool:
+    return any(marker in exc.stderr for marker in _DEVICE_GONE_MARKERS)
+
+
+# Shell/service errors meaning `cmd package` is unavailable on the device
+_MISSING_CMD_MARKERS = ("cmd: not found", "Can't find service")
+
+
+def _is_missing_cmd(output: str) -> bool:
+    """Check if `cmd package` output says the device has no `cmd`."""
+    return any(marker in output for marker in _MISSING_CMD_MARKERS)
+
+
 class ADBWrapper:
     """Wrapper for ADB commands."""
 
@@ -30,6 +177,88 @@ class ADBWrapper:
             device_id: Optional device ID to target. If None, uses default device.
         """
         self.device_id = device_id
+        # Per-instance caches so one CLI invocation never repeats identical
+        # `pm list packages` / `dumpsys package` round-trips.
+        self._package_lists: dict[tuple[bool, str | None], list[str]] = {}
+        self._package_info: dict[str, PackageInfo] = {}
+        self._all_package_info: dict[bool, list[PackageInfo]] = {}
+        # Target device resolved by ensure_device(), shared across threads
+        self._resolved_device: Device | None = None
+        self._device_lock = threading.Lock()
+        # Per-thread persistent `adb shell` (see shell_session())
+        self._sessions = threading.local()
+        # Whether the device has `cmd package` (None: not probed yet)
+        self._has_cmd_package: bool | None = None
+        # Whether adb's shell protocol is available (None: not probed yet)
+        self._has_shell_v2: bool | None = None
+
+    def _adb_command(self, *args: str) -> list[str]:
+        cmd = ["adb"]
+        if self.device_id:
+            cmd.extend(["-s", self.device_id])
+        cmd.extend(args)
+        return cmd
+
+    @contextlib.contextmanager
+    def shell_session(self) -> Iterator[None]:
+        """Run this thread's shell commands through one `adb shell` process.
+
+        While the outermost block is open, `adb shell ...` calls made by
+        _adb()/_adb_stream() on this thread are written to a single
+        persistent shell instead of each spawning adb and connecting to the
+        device. The shell starts on the first such call and ends when the
+        outermost block exits; nested blocks share it. Output of commands
+        run this way has stderr merged into stdout.
+
+        Devices without the `shell_v2` feature only offer a PTY shell, which
+        echoes input and mangles line endings; there, commands keep running
+        one adb process each.
+        """
+        local = self._sessions
+        depth = getattr(local, "depth", 0)
+        local.depth = depth + 1
+        try:
+            yield
+        finally:
+            local.depth = depth
+            session: ShellSession | None = getattr(local, "session", None)
+            if depth == 0 and session is not None:
+                local.session = None
+                session.close()
+
+    def _shell_session(self) -> ShellSession | None:
+        """Get this thread's open shell session, starting it if needed."""
+        local = self._sessions
+        if not getattr(local, "depth", 0):
+            return None
+
+        session: ShellSession | None = getattr(local, "session", None)
+        if session is None or not session.alive:
+            if not self._supports_shell_v2():
+                return None
+            session = ShellSession(self._adb_command("shell"))
+            local.session = session
+        return session
+
+    def _supports_shell_v2(self) -> bool:
+        """Check once per wrapper if the device speaks adb's shell protocol."""
+        if self._has_shell_v2 is None:
+            try:
+                features = run_tool(self._adb_command("features"))
+            except ProcessError as e:
+                self._note_failure(e)
+                return False
+            self._has_shell_v2 = (
+                "shell_v2" in features.stdout.replace(",", "\n").split()
+            )
+        return self._has_shell_v2
+
+    def _note_failure(self, exc: ProcessError) -> None:
+        """Forget the resolved device if an adb error says it is gone."""
+        if _is_device_gone(exc):
+            # Make the next ensure_device() look the device up again
+            self.invalidate_devices_cache()
+            self.invalidate_device()
 
     def _adb(self, *args: str, check: bool = True) -> list[str]:
         """Run an ADB command and return output lines.
@@ -41,29 +270,125 @@ class ADBWrapper:
         Returns:
             List of output lines.
         """
-        cmd = ["adb"]
-        if self.device_id:
-            cmd.extend(["-s", self.device_id])
-        cmd.extend(args)
+        try:
+            if args[:1] == ("shell",):
+                session = self._shell_session()
+                if session is not None:
+                    return session.run(" ".join(args[1:]), check=check)
+
+            return run_tool(self._adb_command(*args), check=check).lines
+        except ProcessError as e:
+            self._note_failure(e)
+            raise
+
+    def _pm(self, *args: str) -> list[str]:
+        """Run a package manager command on the device.
+
+        Prefers `cmd package`, a direct binder call to the running package
+        service, over the `pm` wrapper, which starts a new app_process
+        runtime for every call. Devices without `cmd` (before Android 7)
+        fall back to `pm`; the outcome is remembered per wrapper.
+
+        Old devices lack adb's shell protocol, so a missing `cmd` there
+        exits 0 with the shell error on stdout; that is detected from the
+        output too. Output without any `package:` line is inconclusive
+        (e.g. no third-party apps): that call is answered by `pm`, and the
+        check is repeated next time.
+
+        Args:
+            *args: Package manager arguments (e.g. "list", "packages").
+
+        Returns:
+            List of output lines.
+        """
+        if self._has_cmd_package is not False:
+            try:
+                lines = self._adb("shell", "cmd", "package", *args)
+            except ProcessError as e:
+                if self._has_cmd_package or not _is_missing_cmd(e.stderr):
+                    raise
+                self._has_cmd_package = False
+            else:
+                if self._has_cmd_package:
+                    return lines
+                if any(line.startswith("package:") for line in lines):
+                    self._has_cmd_package = True
+                    return lines
+                if _is_missing_cmd("\n".join(lines)):
+                    self._has_cmd_package = False
+
+        return self._adb("shell", "pm", *args)
+
+    def _adb_stream(
+        self, *args: str, check: bool = True, reuse_session: bool = True
+    ) -> Generator[str]:
+        """Run an ADB command and yield output lines as they arrive.
+
+        Use for large outputs (e.g. dumpsys) that callers may stop reading
+        early; closing the generator terminates the adb process. Inside a
+        shell session the rest of the output is drained instead, so close
+        the generator before running the next command.
 
-        result = run_tool(cmd, check=check)
-        return result.lines
+        Args:
+            *args: ADB command arguments.
+            check: If True, raise on non-zero exit.
+            reuse_session: If False, always spawn adb, e.g. when stopping
+                early matters more than the process launch.
+        """
+        lines: Generator[str] | None = None
+        if reuse_session and args[:1] == ("shell",):
+            session = self._shell_session()
+            if session is not None:
+                lines = session.stream(" ".join(args[1:]), check=check)
+        if lines is None:
+            lines = stream_tool(self._adb_command(*args), check=check)
+
+        try:
+            yield from lines
+        except ProcessError as e:
+            self._note_failure(e)
+            raise
 
     def list_devices(self) -> DeviceList:
         """List all connected ADB devices.
 
+        The listing is shared by all wrappers for DEVICES_CACHE_TTL seconds,
+        so back-to-back lookups don't each fork `adb devices -l`. Call
+        invalidate_devices_cache() after connecting or rebooting a device.
+
         Returns:
             DeviceList containing all connected devices.
         """
+        global _devices_cache
+
+        with _devices_lock:
+            if (
+                _devices_cache is not None
+                and time.monotonic() - _devices_cache[0] < DEVICES_CACHE_TTL
+            ):
+                return _devices_cache[1]
+
+            device_list = self._list_devices()
+            _devices_cache = (time.monotonic(), device_list)
+            return device_list
+
+    @staticmethod
+    def invalidate_devices_cache() -> None:
+        """Drop the shared `adb devices -l` listing."""
+        global _devices_cache
+
+        with _devices_lock:
+            _devices_cache = None
+
+    def _list_devices(self) -> DeviceList:
+        """Parse `adb devices -l` output."""
         # Run without device selector
         result = run_tool(["adb", "devices", "-l"])
         devices = []
 
         for line in result.lines[1:]:  # Skip header line
-            if not line.strip():
-                continue
-
-            parts = line.split()
+            # Format: <serial> <state> [key:value ...]; blank lines split to []
+            parts = line.split(None, 2)
             if len(parts) < 2:
                 continue
 
@@ -81,13 +406,15 @@ class ADBWrapper:
             product = None
             transport_id = None
 
-            for part in parts[2:]:
-                if part.startswith("model:"):
-                    model = part.split(":", 1)[1]
-                elif part.startswith("product:"):
-                    product = part.split(":", 1)[1]
-                elif part.startswith("transport_id:"):
-                    transport_id = part.split(":", 1)[1]
+            properties = parts[2].split() if len(parts) == 3 else []
+            for part in properties:
+                key, _, value = part.partition(":")
+                if key == "model":
+                    model = value
+                elif key == "product":
+                    product = value
+                elif key == "transport_id":
+                    transport_id = value
 
             devices.append(
                 Device(
@@ -99,17 +426,44 @@ class ADBWrapper:
                 )
             )
 
-        return DeviceList(devices=devices)
+        return DeviceList(devices=tuple(devices))
 
     def ensure_device(self) -> Device:
         """Ensure a device is available and return it.
 
+        The device is resolved with `adb devices -l` once per wrapper and then
+        reused until an adb command reports it missing or offline. Call
+        refresh_device() when the connection may have changed.
+
         Returns:
             The target device.
 
         Raises:
             DeviceNotFoundError: If no device is connected or device not found.
         """
+        with self._device_lock:
+            if self._resolved_device is None:
+                self._resolved_device = self._resolve_device()
+            return self._resolved_device
+
+    def invalidate_device(self) -> None:
+        """Forget the device resolved by ensure_device()."""
+        with self._device_lock:
+            self._resolved_device = None
+            self._has_shell_v2 = None
+
+    def refresh_device(self) -> Device:
+        """Resolve the target device again from a fresh `adb devices -l`.
+
+        Raises:
+            DeviceNotFoundError: If no device is connected or device not found.
+        """
+        self.invalidate_devices_cache()
+        self.invalidate_device()
+        return self.ensure_device()
+
+    def _resolve_device(self) -> Device:
+        """Look up the target device in `adb devices -l` output."""
         devices = self.list_devices()
 
         if self.device_id:
@@ -145,30 +499,60 @@ class ADBWrapper:
     ) -> list[str]:
         """List all installed packages.
 
+        Results are cached per (include_system, filter). Filtered listings are
+        always derived locally from the cached unfiltered listing, so any
+        number of different filters costs a single `pm list packages` call.
+
         Args:
             include_system: If True, include system packages.
+            filter: Optional substring that package names must contain.
 
         Returns:
             List of package names.
         """
-        self.ensure_device()
+        key = (include_system, filter or None)
+        cached = self._package_lists.get(key)
+        if cached is not None:
+            return list(cached)
 
-        cmd = ["shell", "pm", "list", "packages"]
+        if filter:
+            # Same substring semantics as `pm list packages <filter>`
+            full = self.list_packages(include_system=include_system)
+            packages = [name for name in full if filter in name]
+        else:
+            self.ensure_device()
 
-        if not include_system:
-            cmd.append("-3")
+            cmd = ["list", "packages"]
 
-        if filter:
-            cmd.append(filter)
+            if not include_system:
+                cmd.append("-3")
 
-        lines = self._adb(*cmd)
+            packages = [
+                line.removeprefix("package:")
+                for line in self._pm(*cmd)
+                if line.startswith("package:")
+            ]
+            packages.sort()
 
-        packages = []
-        for line in lines:
-            if line.startswith("package:"):
-                packages.append(line.split(":", 1)[1])
+        self._package_lists[key] = packages
+        return list(packages)
 
-        return sorted(packages)
+    def invalidate_cache(self) -> None:
+        """Drop cached package listings and metadata.
+
+        Call after installing or uninstalling packages on the device.
+        """
+        self._package_lists.clear()
+        self._package_info.clear()
+        self._all_package_info.clear()
+
+    def prime_cache(self, include_system: bool = False) -> None:
+        """List all packages once so later lookups are served from memory.
+
+        Args:
+            include_system: If True, include system packages.
+        """
+        self.list_packages(include_system=include_system)
 
     def search_packages(
         self,
@@ -178,8 +562,8 @@ class ADBWrapper:
     ) -> list[PackageInfo]:
         """Search for packages matching a query.
 
-        By default, searches package names only using ADB's native filter.
-        Use detailed=True to fetch full package metadata (slower).
+        By default, searches package names only, against the cached package
+        listing. Use detailed=True to fetch full package metadata (slower).
 
         Args:
             query: Search query (substring match against package names).
@@ -189,23 +573,173 @@ class ADBWrapper:
         Returns:
             List of matching PackageInfo objects.
         """
+        with self.shell_session():
+            # Fast path: substring match over the cached listing
+            matches = self.list_packages(include_system=include_system, filter=query)
+
+            # Build results - only fetch full info if detailed=True
+            if detailed:
+                return self.get_packages_info(matches)
+
+            # Names come straight from `pm list packages`: skip model validation
+            return [PackageInfo.model_construct(package_name=pkg) for pkg in matches]
+
+    def get_packages_info(self, package_names: list[str]) -> list[PackageInfo]:
+        """Get detailed information for several packages concurrently.
+
+        When the uncached packages are a large share of everything installed,
+        they are fetched with one batched dumpsys scan (see
+        get_all_package_info). The remaining lookups are I/O-bound ``adb
+        shell`` round-trips, so they are dispatched to a thread pool instead
+        of running one after another; each worker keeps its own shell
+        session for all of its lookups.
+
+        Args:
+            package_names: Full package names.
+
+        Returns:
+            PackageInfo objects in the same order as package_names. Packages
+            whose metadata cannot be read fall back to a bare PackageInfo.
+        """
+        if not package_names:
+            return []
+
+        missing = [n for n in package_names if n not in self._package_info]
+        if len(missing) >= BATCH_INFO_THRESHOLD and not self._all_package_info:
+            with contextlib.suppress(Exception):
+                installed = self.list_packages(include_system=True)
+                if len(missing) >= BATCH_INFO_MIN_FRACTION * len(installed):
+                    # Fills the per-package cache for every installed package
+                    self.get_all_package_info(include_system=True)
+
+        results = [self._package_info.get(name) for name in package_names]
+        pending = [i for i, info in enumerate(results) if info is None]
+        if not pending:
+            return [info for info in results if info is not None]
+
+        if len(pending) == 1:
+            # Nothing to overlap: stay on this thread and its shell session
+            i = pending[0]
+            try:
+                results[i] = self.get_package_info(package_names[i])
+            except Exception:
+                results[i] = PackageInfo.model_construct(package_name=package_names[i])
+            return [info for info in results if info is not None]
+
+        workers = min(MAX_INFO_WORKERS, len(pending))
+
+        def fetch(indices: list[int]) -> None:
+            # One adb shell per worker, reused for all of its lookups
+            with self.shell_session():
+                for i in indices:
+                    try:
+                        results[i] = self.get_package_info(package_names[i])
+                    except Exception:
+                        results[i] = PackageInfo.model_construct(
+                            package_name=package_names[i]
+                        )
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(fetch, pending[w::workers]) for w in range(workers)
+            ]
+            for future in futures:
+                future.result()
+
+        return [info for info in results if info is not None]
+
+    def get_all_package_info(self, include_system: bool = False) -> list[PackageInfo]:
+        """Get detailed information for every installed package at once.
+
+        Uses two device round-trips in total: `pm list packages -f` for the
+        package set and base APK paths, and `dumpsys package packages` for
+        versions, SDK levels, signing and split names. Results are cached
+        per include_system and also fill the per-package info cache, except
+        for packages whose split names dumpsys didn't report.
+
+        Args:
+            include_system: If True, include system packages.
+
+        Returns:
+            PackageInfo objects sorted by package name.
+        """
+        cached = self._all_package_info.get(include_system)
+        if cached is not None:
+            return list(cached)
+
         self.ensure_device()
 
-        # Fast path: use ADB's native package name filter
-        matches = self.list_packages(include_system=include_system, filter=query)
+        cmd = ["list", "packages", "-f"]
+        if not include_system:
+            cmd.append("-3")
 
-        # Build results - only fetch full info if detailed=True
-        results = []
-        for pkg in matches:
-            if detailed:
-                try:
-                    results.append(self.get_package_info(pkg))
-                except Exception:
-                    results.append(PackageInfo(package_name=pkg))
-            else:
-                results.append(PackageInfo(package_name=pkg))
+        # Format: package:/data/app/~~x==/com.example-y==/base.apk=com.example
+        base_paths: dict[str, str] = {}
+        for line in self._pm(*cmd):
+            if line.startswith("package:"):
+                path, sep, name = line[len("package:") :].rpartition("=")
+                if sep:
+                    base_paths[name] = path
+
+        records: dict[str, _PackageRecord] = {}
+        current: _PackageRecord | None = None
+        # Own adb process: stopping at the hidden packages section then
+        # skips the rest of the dump instead of draining it from a session
+        dumpsys = self._adb_stream(
+            "shell", "dumpsys", "package", "packages", reuse_session=False
+        )
+        for line in dumpsys:
+            if not line[:1].isspace():
+                # Section header: the previous package record has ended.
+                # Hidden system packages are superseded copies; skip the rest.
+                if line.startswith("Hidden system packages:"):
+                    break
+                current = None
+                continue
 
-        return results
+            match = _DUMPSYS_PACKAGE_RE.match(line)
+            if match:
+                name = match.group(1)
+                current = (
+                    records.setdefault(name, _PackageRecord())
+                    if name in base_paths
+                    else None
+                )
+            elif current is not None:
+                current.feed(line)
+
+        packages = []
+        for name in sorted(base_paths):
+            base_apk = base_paths[name]
+            record = records.get(name, _PackageRecord())
+            code_dir = posixpath.dirname(base_apk)
+            split_apks = [
+                f"{code_dir}/split_{split}.apk"
+                for split in record.splits or []
+                if split != "base"
+            ]
+
+            info = PackageInfo(
+                package_name=name,
+                version_name=record.version_name,
+                version_code=record.version_code,
+                min_sdk=record.min_sdk,
+                target_sdk=record.target_sdk,
+                signing_version=record.signing_version,
+                apk_path=base_apk,
+                split_apks=split_apks if split_apks else None,
+            )
+            # Without a splits= line (older releases never print one) the
+            # split set is unknown; leave it to get_package_info's pm path
+            # fallback rather than caching base.apk alone. Only directory
+            # installs (.../base.apk) can have splits at all.
+            if record.splits is not None or not base_apk.endswith("/base.apk"):
+                self._package_info[name] = info
+            packages.append(info)
+
+        self._package_lists[(include_system, None)] = [p.package_name for p in packages]
+        self._all_package_info[include_system] = packages
+        return list(packages)
 
     def get_package_info(self, package_name: str) -> PackageInfo:
         """Get detailed information about a package.
@@ -219,20 +753,72 @@ class ADBWrapper:
         Raises:
             PackageNotFoundError: If package is not installed.
         """
+        cached = self._package_info.get(package_name)
+        if cached is not None:
+            return cached
+
         self.ensure_device()
 
+        with self.shell_session():
+            record = _PackageRecord()
+            paths = None
+
+            dumpsys = self._adb_stream("shell", "dumpsys", "package", package_name)
+            try:
+                with contextlib.closing(dumpsys):
+                    for line in dumpsys:
+                        # Updated system apps also list their superseded copy
+                        if line.startswith("Hidden system packages:"):
+                            break
+
+                        record.feed(line)
+
+                        # Stop early if we have all the info we need
+                        if record.complete and record.splits is not None:
+                            break
+            except Exception:
+                # Keep the fields already read, but a cut-off record may
+                # have lost its splits= line: leave the paths to `pm path`
+                pass
+            else:
+                # dumpsys already names the APK files for regular installs;
+                # only ask `pm path` when the layout can't be derived
+                paths = record.apk_paths()
+
+            base_apk, split_apks = paths if paths else self._get_apk_paths(package_name)
+
+        info = PackageInfo(
+            package_name=package_name,
+            version_name=record.version_name,
+            version_code=record.version_code,
+            min_sdk=record.min_sdk,
+            target_sdk=record.target_sdk,
+            signing_version=record.signing_version,
+            apk_path=base_apk,
+            split_apks=split_apks if split_apks else None,
+        )
+        self._package_info[package_name] = info
+        return info
+
+    def _get_apk_paths(self, package_name: str) -> tuple[str | None, list[str]]:
+        """Get base and split APK paths from `pm path`.
+
+        Raises:
+            PackageNotFoundError: If package is not installed.
+        """
         try:
-            lines = self._adb("shell", "pm", "path", package_name)
+            lines = self._pm("path", package_name)
         except Exception as exc:
             raise PackageNotFoundError(package_name) from exc
 
         if not lines:
             raise PackageNotFoundError(package_name)
 
-        apk_paths = []
-        for line in lines:
-            if line.startswith("package:"):
-                apk_paths.append(line.split(":", 1)[1])
+        apk_paths = [
+            line.removeprefix("package:")
+            for line in lines
+            if line.startswith("package:")
+        ]
 
         if not apk_paths:
             raise PackageNotFoundError(package_name)
@@ -250,74 +836,46 @@ class ADBWrapper:
             else:
                 split_apks.append(path)
 
-        # Initialize all variables
-        version_name: str | None = None
-        version_code: int | None = None
-        min_sdk: int | None = None
-        target_sdk: int | None = None
-        signing_version: int | None = None
+        return base_apk, split_apks
 
-        try:
-            dumpsys = self._adb("shell", "dumpsys", "package", package_name)
-            for line in dumpsys:
-                line = line.strip()
-
-                if line.startswith("versionName="):
-                    version_name = line.split("=", 1)[1]
-
-                elif line.startswith("apkSigningVersion="):
-                    with contextlib.suppress(ValueError):
-                        signing_version = int(line.split("=", 1)[1])
-
-                elif line.startswith("versionCode="):
-                    # Format: versionCode=123 minSdk=21 targetSdk=34
-                    parts = line.split()
-                    for part in parts:
-                        if "=" in part:
-                            key, value = part.split("=", 1)
-                            with contextlib.suppress(ValueError):
-                                if key == "versionCode":
-                                    version_code = int(value)
-                                elif key == "minSdk":
-                                    min_sdk = int(value)
-                                elif key == "targetSdk":
-                                    target_sdk = int(value)
-
-                # Stop early if we have all the info we need
-                if all(
-                    [
-                        version_name,
-                        version_code is not None,
-                        min_sdk is not None,
-                        target_sdk is not None,
-                        signing_version is not None,
-                    ]
-                ):
-                    break
-        except Exception:
-            pass
+    def install_apk(self, apk_path: Path) -> None:
+        """Install an APK on the device, replacing any existing install.
 
-        return PackageInfo(
-            package_name=package_name,
-            version_name=version_name,
-            version_code=version_code,
-            min_sdk=min_sdk,
-            target_sdk=target_sdk,
-            signing_version=signing_version,
-            apk_path=base_apk,
-            split_apks=split_apks if split_apks else None,
-        )
+        The app is upgraded in place (`adb install -r`), so its data survives
+        and no separate uninstall round-trip is needed. adb streams the APK
+        straight to the package manager on devices that support it, without
+        staging a copy on the device first. Package caches are dropped
+        afterwards.
+
+        Args:
+            apk_path: Local APK to install.
+
+        Raises:
+            ADBError: If installation fails.
+        """
+        self.ensure_device()
+
+        try:
+            self._adb("install", "-r", str(apk_path))
+        except ProcessError as e:
+            raise ADBError(f"Failed to install {apk_path.name}: {e}") from e
+        finally:
+            # Even a failed install may have replaced or removed the package
+            self.invalidate_cache()
 
     def pull_apk(
         self,
         package_name: str,
         output_dir: Path | None = None,
+        reuse_cached: bool = False,
     ) -> PulledAPK:
         """Pull APK(s) from a device.
 
         Args:
             package_name: Package name to pull.
             output_dir: Directory to save APKs. Defaults to current directory.
+            reuse_cached: If True, keep local files from an earlier pull whose
+                MD5 matches the device copy instead of transferring them again.
 
         Returns:
             PulledAPK with paths to pulled files.
@@ -331,11 +889,39 @@ class ADBWrapper:
         output_dir.mkdir(parents=True, exist_ok=True)
 
         if info.is_split:
-            return self._pull_split_apk(info, output_dir)
+            return self._pull_split_apk(info, output_dir, reuse_cached)
         else:
-            return self._pull_single_apk(info, output_dir)
+            return self._pull_single_apk(info, output_dir, reuse_cached)
+
+    def _pull_file(
+        self, device_path: str, output_path: Path, reuse_cached: bool
+    ) -> None:
+        """Pull one file, unless reuse_cached and the local copy is identical."""
+        if reuse_cached and self._is_pulled(device_path, output_path):
+            return
+        self._adb("pull", device_path, str(output_path))
+
+    def _is_pulled(self, device_path: str, output_path: Path) -> bool:
+        """Check if output_path already holds the device file (by MD5)."""
+        try:
+            with output_path.open("rb") as f:
+                digest = hashlib.file_digest(
+                    f, lambda: hashlib.md5(usedforsecurity=False)
+                )
+        except OSError:
+            return False
+
+        try:
+            lines = self._adb("shell", "md5sum", device_path)
+        except Exception:
+            return False
+
+        # Format: d41d8cd98f00b204e9800998ecf8427e  /data/app/.../base.apk
+        return bool(lines) and lines[0].split()[0] == digest.hexdigest()
 
-    def _pull_single_apk(self, info: PackageInfo, output_dir: Path) -> PulledAPK:
+    def _pull_single_apk(
+        self, info: PackageInfo, output_dir: Path, reuse_cached: bool = False
+    ) -> PulledAPK:
         """Pull a single APK."""
         if not info.apk_path:
             raise APKPullError(f"No APK path for {info.package_name}")
@@ -348,22 +934,21 @@ class ADBWrapper:
         output_path = output_dir / filename
 
         try:
-            self._adb("pull", info.apk_path, str(output_path))
+            self._pull_file(info.apk_path, output_path, reuse_cached)
         except Exception as e:
             if _is_permission_error(e):
                 raise APKPermissionError(info.package_name, info.apk_path) from e
             raise APKPullError(f"Failed to pull {info.package_name}: {e}") from e
 
-        if not output_path.exists():
-            raise APKPermissionError(info.package_name, info.apk_path)
-
         return PulledAPK(
             package_name=info.package_name,
             local_path=output_path,
             is_split=False,
         )
 
-    def _pull_split_apk(self, info: PackageInfo, output_dir: Path) -> PulledAPK:
+    def _pull_split_apk(
+        self, info: PackageInfo, output_dir: Path, reuse_cached: bool = False
+    ) -> PulledAPK:
         """Pull a split APK (base + splits)."""
         # Create a directory for this package's APKs
         pkg_dir = output_dir / info.package_name
@@ -372,24 +957,34 @@ class ADBWrapper:
 
         pkg_dir.mkdir(parents=True, exist_ok=True)
 
-        pulled_paths = []
-
-        for apk_path in info.all_apk_paths:
-            # Extract filename from device path
-            filename = Path(apk_path).name
-            output_path = pkg_dir / filename
-
-            try:
-                self._adb("pull", apk_path, str(output_path))
-                pulled_paths.append(output_path)
-            except Exception as e:
-                # Clean up on failure
-                shutil.rmtree(pkg_dir, ignore_errors=True)
-                if _is_permission_error(e):
-                    raise APKPermissionError(info.package_name, apk_path) from e
-                raise APKPullError(
-                    f"Failed to pull {filename} for {info.package_name}: {e}"
-                ) from e
+        apk_paths = info.all_apk_paths
+        # Extract filenames from device paths
+        pulled_paths = [pkg_dir / Path(apk_path).name for apk_path in apk_paths]
+
+        # Each part is an independent, I/O-bound `adb pull`
+        workers = min(MAX_SPLIT_PULL_WORKERS, len(apk_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._pull_file, apk_path, output_path, reuse_cached): i
+                for i, (apk_path, output_path) in enumerate(
+                    zip(apk_paths, pulled_paths, strict=True)
+                )
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    # Stop queued pulls and wait for running ones before
+                    # cleaning up on failure
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    shutil.rmtree(pkg_dir, ignore_errors=True)
+                    apk_path = apk_paths[futures[future]]
+                    if _is_permission_error(e):
+                        raise APKPermissionError(info.package_name, apk_path) from e
+                    filename = pulled_paths[futures[future]].name
+                    raise APKPullError(
+                        f"Failed to pull {filename} for {info.package_name}: {e}"
+                    ) from e
 
         return PulledAPK(
             package_name=info.package_name,
@@ -406,6 +1001,11 @@ class ADBWrapper:
     ) -> PackageInfo:
         """Find a single package matching query.
 
+        Matches are ranked in tiers and the first non-empty tier wins: an
+        exact package name, then names starting with query, then names
+        containing it. Exact and prefix lookups bisect the sorted cached
+        listing instead of scanning it.
+
         Args:
             query: Package name or filter (substring match).
             include_system: If True, include system packages.
@@ -418,11 +1018,27 @@ class ADBWrapper:
             PackageNotFoundError: If no package matches.
             MultiplePackagesFoundError: If multiple matches and not allow_multiple.
         """
-        matches = self.search_packages(
-            query,
-            include_system=include_system,
-            detailed=detailed,
-        )
+        with self.shell_session():
+            names = self.list_packages(include_system=include_system)
+
+            start = bisect_left(names, query)
+            end = start
+            while end < len(names) and names[end].startswith(query):
+                end += 1
+
+            if start < end and names[start] == query:
+                found = [query]
+            elif start < end:
+                found = names[start:end]
+            else:
+                found = self.list_packages(include_system=include_system, filter=query)
+
+            if detailed:
+                matches = self.get_packages_info(found)
+            else:
+                matches = [
+                    PackageInfo.model_construct(package_name=name) for name in found
+                ]
 
         if not matches:
             raise PackageNotFoundError(query)
@@ -430,4 +1046,19 @@ class ADBWrapper:
         if len(matches) == 1:
             return matches[0]
 
-        raise MultiplePackagesFoundError(query, [m.package_name for m in matches])
+        raise MultiplePackagesFoundError(
+            query, [m.package_name for m in matches], matches
+        )
+
+
+@lru_cache(maxsize=8)
+def get_adb(device_id: str | None = None) -> ADBWrapper:
+    """Get the shared ADBWrapper for a device.
+
+    Commands running in the same process reuse one wrapper per device, and
+    with it the package listing and metadata caches.
+
+    Args:
+        device_id: Optional device ID to target. If None, uses default device.
+    """
+    return ADBWrapper(device_id=device_id)
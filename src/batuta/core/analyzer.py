@@ -1,11 +1,14 @@
 """APK analysis: detect cross-platform frameworks and native libraries."""
 
+import os
+import re
+from collections.abc import Iterable
 from pathlib import Path
 from zipfile import BadZipFile, ZipFile
 
 from batuta.exceptions import AnalysisError
 from batuta.models.analyze import FrameworkMatch, FrameworkResult
-from batuta.utils.apk import validate_apk_path
+from batuta.utils.apk import read_entry_names, validate_apk_path
 
 
 class FrameworkDetector:
@@ -50,62 +53,124 @@ class FrameworkDetector:
                 to scan all parts of a split APK together.
         """
         self.apk_paths = [p.resolve() for p in apk_paths]
-
-    def _collect_native_libs(self, namelist: list[str]) -> list[str]:
-        """Extract native library paths from APK file list.
+        # Entry names per APK, keyed on (size, mtime_ns) so edits are noticed
+        self._entry_names: dict[Path, tuple[tuple[int, int], list[str]]] = {}
+
+        # Signature index: exact file paths and directory prefixes ("dir/")
+        # map to their frameworks, so each entry is matched in a single pass
+        # whose cost does not grow with the number of signatures.
+        self._file_signatures: dict[str, list[str]] = {}
+        self._dir_signatures: dict[str, list[str]] = {}
+        for framework, signatures in self.FRAMEWORK_SIGNATURES.items():
+            for sig in signatures:
+                index = (
+                    self._dir_signatures if sig.endswith("/") else self._file_signatures
+                )
+                index.setdefault(sig, []).append(framework)
+
+        # Prefilter: one anchored alternation over every signature (files
+        # must match whole, directories as a prefix). Almost no entry
+        # matches, and rejecting them here is cheaper than walking each
+        # entry's directory prefixes through the index.
+        alternatives = [re.escape(sig) for sig in self._dir_signatures]
+        alternatives += [rf"{re.escape(sig)}\Z" for sig in self._file_signatures]
+        self._signature_re = re.compile("|".join(alternatives) or "(?!)")
+
+    def _scan_entries(
+        self,
+        entries: Iterable[str],
+        matches: dict[str, set[str]],
+        native_libs: list[str] | None,
+    ) -> None:
+        """Match signatures and collect native libraries in one pass.
+
+        When native libraries are not collected, the scan stops as soon as
+        every signature has matched, since later entries can't add evidence.
+        With native_libs the whole listing must be read.
 
         Args:
-            namelist: List of file paths in the APK.
-
-        Returns:
-            Sorted list of .so file paths.
+            entries: File paths in the APK.
+            matches: Framework name -> matched signatures, updated in place.
+            native_libs: If not None, .so paths are appended to it.
         """
-        return sorted(entry for entry in namelist if entry.endswith(".so"))
+        file_signatures = self._file_signatures
+        dir_signatures = self._dir_signatures
+        total = len(file_signatures) + len(dir_signatures)
+        seen: set[str] = set().union(*matches.values())
+        could_match = self._signature_re.match
+
+        for entry in entries:
+            if native_libs is not None and entry.endswith(".so"):
+                native_libs.append(entry)
+
+            if not could_match(entry):
+                continue
+
+            frameworks = file_signatures.get(entry)
+            if frameworks:
+                for framework in frameworks:
+                    matches.setdefault(framework, set()).add(entry)
+                seen.add(entry)
+                if native_libs is None and len(seen) == total:
+                    return
+
+            if not dir_signatures:
+                continue
+
+            # Check each directory prefix of the entry ("a/", "a/b/", ...)
+            slash = entry.find("/")
+            while slash != -1:
+                prefix = entry[: slash + 1]
+                frameworks = dir_signatures.get(prefix)
+                if frameworks:
+                    for framework in frameworks:
+                        matches.setdefault(framework, set()).add(prefix)
+                    seen.add(prefix)
+                    if native_libs is None and len(seen) == total:
+                        return
+                slash = entry.find("/", slash + 1)
+
+    def _read_entry_names(self, apk_path: Path) -> list[str]:
+        """Get an APK's entry names, re-reading them only if the file changed.
 
-    def _detect_frameworks(self, namelist: list[str]) -> list[FrameworkMatch]:
-        """Detect frameworks based on signature matching.
-
-        Args:
-            namelist: List of file paths in the APK.
-
-        Returns:
-            List of detected frameworks with matched evidence.
+        Raises:
+            AnalysisError: If the APK cannot be read or is invalid.
         """
-        # Convert to set for O(1) lookups
-        files_set = set(namelist)
-        # Also track directory prefixes for directory-based signatures
-        detected: list[FrameworkMatch] = []
-
-        for framework, signatures in self.FRAMEWORK_SIGNATURES.items():
-            matched_files: list[str] = []
-
-            for sig in signatures:
-                if sig.endswith("/"):
-                    # Directory signature: check if any file starts with this path
-                    for entry in namelist:
-                        if entry.startswith(sig):
-                            matched_files.append(sig)
-                            break
-                elif sig in files_set:
-                    matched_files.append(sig)
-
-            if matched_files:
-                detected.append(
-                    FrameworkMatch(
-                        name=framework,
-                        matched_files=sorted(set(matched_files)),
-                    )
-                )
-
-        # Sort by framework name for deterministic output
-        return sorted(detected, key=lambda m: m.name)
+        try:
+            st = os.stat(apk_path)
+            stamp = (st.st_size, st.st_mtime_ns)
+        except OSError:
+            stamp = None
+        cached = self._entry_names.get(apk_path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        validate_apk_path(apk_path, error_cls=AnalysisError)
+        try:
+            names = read_entry_names(apk_path)
+            if names is None:
+                with ZipFile(apk_path, "r") as apk_zip:
+                    names = apk_zip.namelist()
+        except BadZipFile as e:
+            raise AnalysisError(
+                f"Invalid APK {apk_path.name} (not a valid ZIP file): {e}"
+            ) from e
+        except OSError as e:
+            raise AnalysisError(f"Failed to read {apk_path.name}: {e}") from e
+
+        if stamp is not None:
+            self._entry_names[apk_path] = (stamp, names)
+        return names
 
     def detect(self, include_native_libs: bool = True) -> FrameworkResult:
         """Analyze APK(s) and return detected frameworks and native libraries.
 
-        Aggregates file listings across all provided APK paths before matching,
-        so split APKs (where libs and assets live in separate parts) are handled
-        correctly.
+        Matches are aggregated across all provided APK paths, so split APKs
+        (where libs and assets live in separate parts) are handled correctly.
+        Each APK's entries are scanned once, without building a combined list.
+        Entry names are read directly from the ZIP central directory when
+        possible, falling back to ZipFile otherwise, and are cached so later
+        calls on the same detector don't re-read the APKs.
 
         Args:
             include_native_libs: If True, include list of all native libraries.
@@ -116,26 +181,21 @@ class FrameworkDetector:
         Raises:
             AnalysisError: If any APK cannot be read or is invalid.
         """
-        combined: list[str] = []
+        matches: dict[str, set[str]] = {}
+        native_libs: list[str] | None = [] if include_native_libs else None
+
         for apk_path in self.apk_paths:
-            validate_apk_path(apk_path, error_cls=AnalysisError)
-            try:
-                with ZipFile(apk_path, "r") as apk_zip:
-                    combined.extend(apk_zip.namelist())
-            except BadZipFile as e:
-                raise AnalysisError(
-                    f"Invalid APK {apk_path.name} (not a valid ZIP file): {e}"
-                ) from e
-            except OSError as e:
-                raise AnalysisError(f"Failed to read {apk_path.name}: {e}") from e
-
-        detected_frameworks = self._detect_frameworks(combined)
-        native_libraries = (
-            self._collect_native_libs(combined) if include_native_libs else []
-        )
+            names = self._read_entry_names(apk_path)
+            self._scan_entries(names, matches, native_libs)
+
+        # Sort by framework name for deterministic output
+        detected_frameworks = [
+            FrameworkMatch(name=framework, matched_files=sorted(matches[framework]))
+            for framework in sorted(matches)
+        ]
 
         return FrameworkResult(
             apk_paths=self.apk_paths,
             detected_frameworks=detected_frameworks,
-            native_libraries=native_libraries,
+            native_libraries=sorted(native_libs) if native_libs else [],
         )
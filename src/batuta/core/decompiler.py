@@ -1,13 +1,177 @@
 """APK decompilation: extract Java source and smali/resources from APKs."""
 
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
 from batuta.exceptions import DecompileError
 from batuta.models.apk import DecompileResult
 from batuta.utils.apk import validate_apk_path
+from batuta.utils.config import CONFIG_DIR
 from batuta.utils.deps import require
 from batuta.utils.process import run_tool
 
+# Suffix of the completion stamps written next to each finished target
+DONE_STAMP_SUFFIX = ".batuta-done"
+
+
+def _tree_size(root: Path) -> int:
+    """Total size in bytes of the regular files under root."""
+    total = 0
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            with contextlib.suppress(OSError):
+                total += os.lstat(os.path.join(dirpath, name)).st_size
+    return total
+
+
+class DecompileCache:
+    """Content-addressed cache of decompiler output, keyed by APK SHA-256.
+
+    Each entry is a directory holding a ``java/`` and/or ``smali/`` copy of a
+    previous run plus a ``manifest.json`` listing the cached targets and
+    their sizes, so a java-only entry can later be completed with smali (and
+    vice versa).
+
+    The cache is bounded: after each store, least recently used entries
+    (by manifest mtime, refreshed on restore) are evicted until the total
+    fits in max_bytes. Targets larger than max_bytes are not cached.
+    """
+
+    DEFAULT_DIR = CONFIG_DIR / "cache" / "decompile"
+    DEFAULT_MAX_BYTES = 2 * 1024**3
+    MANIFEST_NAME = "manifest.json"
+
+    def __init__(self, root: Path | None = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize decompile cache.
+
+        Args:
+            root: Cache root directory. Defaults to ~/.batuta/cache/decompile/.
+            max_bytes: Size limit for all entries together (default 2 GiB).
+        """
+        self.root = root or self.DEFAULT_DIR
+        self.max_bytes = max_bytes
+        # Serializes manifest read-modify-write when targets are stored together
+        self._manifest_lock = threading.Lock()
+
+    @staticmethod
+    def digest(apk_path: Path) -> str:
+        """Compute the cache key (SHA-256 hex digest) of an APK file."""
+        with apk_path.open("rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.root / key
+
+    def _read_manifest(self, key: str) -> dict[str, Any]:
+        manifest = self._entry_dir(key) / self.MANIFEST_NAME
+        try:
+            data = json.loads(manifest.read_text())
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def targets(self, key: str) -> set[str]:
+        """Get the targets ("java", "smali") cached for a key."""
+        targets = self._read_manifest(key).get("targets")
+        if not isinstance(targets, list):
+            return set()
+        return {t for t in targets if isinstance(t, str)}
+
+    def _entry_size(self, key: str) -> int:
+        """Size of an entry, from its manifest or (if missing) from disk."""
+        sizes = self._read_manifest(key).get("sizes")
+        if isinstance(sizes, dict) and all(isinstance(n, int) for n in sizes.values()):
+            return sum(sizes.values())
+        return _tree_size(self._entry_dir(key))
+
+    def restore(self, key: str, target: str, dest: Path) -> bool:
+        """Copy a cached target into dest, replacing any existing content.
+
+        Returns:
+            True if the target was restored, False on a cache miss.
+        """
+        source = self._entry_dir(key) / target
+        if target not in self.targets(key) or not source.is_dir():
+            return False
+
+        try:
+            shutil.rmtree(dest, ignore_errors=True)
+            shutil.copytree(source, dest, symlinks=True)
+        except OSError:
+            return False
+
+        # Mark the entry as recently used for eviction
+        with contextlib.suppress(OSError):
+            os.utime(self._entry_dir(key) / self.MANIFEST_NAME)
+        return True
+
+    def store(self, key: str, target: str, source: Path) -> None:
+        """Save a decompiled target directory into the cache.
+
+        Failures are ignored: the cache is an optimization only.
+        """
+        size = _tree_size(source)
+        if size > self.max_bytes:
+            return
+
+        entry = self._entry_dir(key)
+        final = entry / target
+        staging = entry / f".{target}.{os.getpid()}.tmp"
+
+        try:
+            entry.mkdir(parents=True, exist_ok=True)
+            shutil.rmtree(staging, ignore_errors=True)
+            shutil.copytree(source, staging, symlinks=True)
+            shutil.rmtree(final, ignore_errors=True)
+            staging.replace(final)
+
+            manifest = entry / self.MANIFEST_NAME
+            with self._manifest_lock:
+                targets = sorted(self.targets(key) | {target})
+                sizes = self._read_manifest(key).get("sizes")
+                if not isinstance(sizes, dict):
+                    sizes = {}
+                sizes = {t: sizes[t] for t in targets if t in sizes} | {target: size}
+                manifest.write_text(
+                    json.dumps({"sha256": key, "targets": targets, "sizes": sizes})
+                )
+                self._evict(keep=key)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def _evict(self, keep: str) -> None:
+        """Delete least recently used entries until the cache fits max_bytes."""
+        try:
+            with os.scandir(self.root) as it:
+                keys = [e.name for e in it if e.is_dir(follow_symlinks=False)]
+        except OSError:
+            return
+
+        entries: list[tuple[float, int, str]] = []
+        for key in keys:
+            try:
+                used = (self._entry_dir(key) / self.MANIFEST_NAME).stat().st_mtime
+            except OSError:
+                used = 0.0  # incomplete entry: evict first
+            entries.append((used, self._entry_size(key), key))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, key in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            shutil.rmtree(self._entry_dir(key), ignore_errors=True)
+            total -= size
+
 
 class APKDecompiler:
     """Handles APK decompilation using jadx and apktool."""
@@ -16,17 +180,23 @@ class APKDecompiler:
         self,
         apk_path: Path,
         output_dir: Path | None = None,
+        cache: DecompileCache | None = None,
     ):
         """Initialize APK decompiler.
 
         Args:
             apk_path: Path to the APK file.
             output_dir: Root output directory. Defaults to ./<apk_stem>/.
+            cache: Optional cache used to skip re-running jadx/apktool on
+                APKs whose content was already decompiled.
         """
         self.apk_path = apk_path.resolve()
         self.output_dir = (
             output_dir.resolve() if output_dir else Path.cwd() / self.apk_path.stem
         )
+        self.cache = cache
+        self._cache_key: str | None = None
+        self._cache_key_lock = threading.Lock()
 
     def validate(self) -> None:
         """Validate that APK exists and is a valid file.
@@ -35,7 +205,10 @@ class APKDecompiler:
             DecompileError: If APK is invalid.
         """
         validate_apk_path(
-            self.apk_path, require_zip_header=True, error_cls=DecompileError
+            self.apk_path,
+            require_zip_header=True,
+            require_zip_trailer=True,
+            error_cls=DecompileError,
         )
 
     def decompile_java(self, output: Path) -> Path:
@@ -98,16 +271,82 @@ class APKDecompiler:
 
         return output
 
+    @staticmethod
+    def _stamp_path(output: Path) -> Path:
+        # Kept next to (not inside) the output so tools and the cache never
+        # see it: .java.batuta-done, .smali.batuta-done
+        return output.with_name(f".{output.name}{DONE_STAMP_SUFFIX}")
+
+    def _apk_stamp(self) -> str:
+        """Identify the APK file version a completed output was made from."""
+        st = self.apk_path.stat()
+        return json.dumps({"size": st.st_size, "mtime_ns": st.st_mtime_ns})
+
+    def _is_up_to_date(self, output: Path) -> bool:
+        """Check if output was completed from the current APK file.
+
+        Only a completion stamp counts: it is written once the tool (or a
+        cache restore) has finished cleanly, so output left behind by an
+        interrupted or failed run is never mistaken for a finished one.
+        """
+        try:
+            stamp = self._stamp_path(output).read_text()
+            return output.is_dir() and stamp == self._apk_stamp()
+        except OSError:
+            return False
+
+    def _run_cached(
+        self,
+        target: str,
+        output: Path,
+        run: Callable[[Path], Path],
+        force: bool = False,
+    ) -> None:
+        """Reuse up-to-date output, restore it from the cache, or run the tool.
+
+        With force, existing output and cache entries are ignored and the tool
+        always runs (its result still refreshes the cache).
+        """
+        if not force and self._is_up_to_date(output):
+            return
+
+        # Invalidate first: the output is about to be (partially) rewritten
+        stamp = self._stamp_path(output)
+        stamp.unlink(missing_ok=True)
+
+        if self.cache is None:
+            run(output)
+            stamp.write_text(self._apk_stamp())
+            return
+
+        # Hash lazily: up-to-date output never needs the APK digest
+        with self._cache_key_lock:
+            if self._cache_key is None:
+                self._cache_key = self.cache.digest(self.apk_path)
+            cache_key = self._cache_key
+
+        if force or not self.cache.restore(cache_key, target, output):
+            run(output)
+            self.cache.store(cache_key, target, output)
+        stamp.write_text(self._apk_stamp())
+
     def decompile(
         self,
         java: bool = True,
         smali: bool = True,
+        force: bool = False,
     ) -> DecompileResult:
         """Execute decompilation workflow.
 
+        Targets already completed from this APK file (same size and mtime,
+        see _is_up_to_date) are reused as-is unless force is set. When both
+        are requested, jadx and apktool run concurrently: they write
+        disjoint directories and spend their time in child processes.
+
         Args:
             java: Whether to decompile to Java source (jadx).
             smali: Whether to decompile to smali/resources (apktool).
+            force: Re-run the tools even if output is up to date or cached.
 
         Returns:
             DecompileResult with paths and success status.
@@ -122,36 +361,39 @@ class APKDecompiler:
 
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        java_dir: Path | None = None
-        smali_dir: Path | None = None
-        java_success = False
-        smali_success = False
-
-        # Decompile Java source
-        if java:
-            java_dir = self.output_dir / "java"
-            try:
-                self.decompile_java(java_dir)
-                java_success = True
-            except DecompileError:
-                # Continue to try smali even if java fails
-                if not smali:
-                    raise
-
-        # Decompile smali/resources
-        if smali:
-            smali_dir = self.output_dir / "smali"
-            try:
-                self.decompile_smali(smali_dir)
-                smali_success = True
-            except DecompileError:
-                # If both failed, raise
-                if java and not java_success:
-                    raise DecompileError(
-                        "Both jadx and apktool decompilation failed"
-                    ) from None
-                if not java:
-                    raise
+        java_dir = self.output_dir / "java" if java else None
+        smali_dir = self.output_dir / "smali" if smali else None
+
+        jobs: list[tuple[str, Path, Callable[[Path], Path]]] = []
+        if java_dir is not None:
+            jobs.append(("java", java_dir, self.decompile_java))
+        if smali_dir is not None:
+            jobs.append(("smali", smali_dir, self.decompile_smali))
+
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = [
+                executor.submit(self._run_cached, target, output, run, force)
+                for target, output, run in jobs
+            ]
+        errors = [future.exception() for future in futures]
+
+        # Anything other than a tool failure (e.g. a missing dependency)
+        # is raised as-is, as it would have been when run in sequence
+        for error in errors:
+            if error is not None and not isinstance(error, DecompileError):
+                raise error
+
+        failures = [error for error in errors if error is not None]
+        if len(failures) == len(errors):
+            if len(failures) > 1:
+                raise DecompileError(
+                    "Both jadx and apktool decompilation failed"
+                ) from None
+            raise failures[0]
+
+        # Either target may fail while the other succeeds
+        java_success = java and errors[0] is None
+        smali_success = smali and errors[-1] is None
 
         return DecompileResult(
             apk_path=self.apk_path,
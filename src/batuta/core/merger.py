@@ -1,14 +1,95 @@
 """Utilities for merging split APK directories into a single APK."""
 
+import os
+import struct
+import zlib
+from collections.abc import Iterable
 from pathlib import Path
+from typing import BinaryIO
+from zipfile import BadZipFile, ZipFile, ZipInfo
 
 from batuta.exceptions import APKMergeError
 from batuta.utils.deps import get_apkeditor_command, require
 from batuta.utils.process import run_tool
 
+# ZIP record layouts used by the in-process merge (no ZIP64 support)
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+_CENTRAL_HEADER = struct.Struct("<4s6H3L5H2L")
+_END_RECORD = struct.Struct("<4s4H2LH")
+_LOCAL_SIGNATURE = b"PK\x03\x04"
+_ZIP_VERSION = 20
+_ZIP_MAX_ENTRIES = 0xFFFF
+_ZIP_MAX_SIZE = 0xFFFFFFFF
+# General purpose flags kept from the source entry: bit 11 (UTF-8 name).
+# Bit 3 (data descriptor) is dropped since sizes go in the local header.
+_KEPT_FLAGS = 0x800
+_COPY_CHUNK_SIZE = 1 << 20
+_ARCHIVE_ERRORS = (BadZipFile, OSError, zlib.error)
+
+# Data alignment for stored entries, as `zipalign -P 16 4` would produce:
+# native libraries on 16 KiB pages (mmap'd when extractNativeLibs=false),
+# everything else on 4 bytes. Padding goes in an Android alignment extra.
+_SO_ALIGNMENT = 16384
+_DEFAULT_ALIGNMENT = 4
+_ALIGNMENT_EXTRA = struct.Struct("<3H")
+_ALIGNMENT_EXTRA_ID = 0xD935
+
+# Manifest strings that make a merged APK uninstallable unless rewritten:
+# split-requirement attributes and Play's splits.required/splits meta-data
+_SPLIT_ATTRIBUTES = (
+    "isSplitRequired",
+    "requiredSplitTypes",
+    "com.android.vending.splits",
+)
+
+
+def _is_signature_file(name: str) -> bool:
+    """Check if an entry belongs to a (now invalid) APK signature."""
+    if name == "stamp-cert-sha256":
+        return True
+    if not name.startswith("META-INF/"):
+        return False
+    return name == "META-INF/MANIFEST.MF" or name.endswith(
+        (".SF", ".RSA", ".DSA", ".EC")
+    )
+
+
+def _mentions_split_attributes(manifest: bytes) -> bool:
+    """Check a binary manifest's string pool for split-requirement attributes."""
+    for attribute in _SPLIT_ATTRIBUTES:
+        if attribute.encode() in manifest:
+            return True
+        if attribute.encode("utf-16-le") in manifest:
+            return True
+    return False
+
+
+def _alignment_extra(data_offset: int, info: ZipInfo) -> bytes:
+    """Build the local extra field that aligns a stored entry's data.
+
+    Args:
+        data_offset: Where the entry data would start with no extra field.
+    """
+    if info.compress_type != 0:
+        return b""
+    alignment = _SO_ALIGNMENT if info.filename.endswith(".so") else _DEFAULT_ALIGNMENT
+    padding = -(data_offset + _ALIGNMENT_EXTRA.size) % alignment
+    return (
+        _ALIGNMENT_EXTRA.pack(_ALIGNMENT_EXTRA_ID, 2 + padding, alignment)
+        + b"\0" * padding
+    )
+
+
+def _dos_datetime(info: ZipInfo) -> tuple[int, int]:
+    """Pack an entry's timestamp into MS-DOS (time, date) fields."""
+    year, month, day, hour, minute, second = info.date_time
+    date = (year - 1980) << 9 | month << 5 | day
+    time = hour << 11 | minute << 5 | second // 2
+    return time, date
+
 
 class SplitAPKMerger:
-    """Merge split APK folders using APKEditor."""
+    """Merge split APK folders via APKEditor, or optionally in-process."""
 
     def __init__(self, split_dir: Path, output_path: Path | None = None):
         self.split_dir = split_dir.resolve()
@@ -20,12 +101,23 @@ class SplitAPKMerger:
         return self.split_dir.parent / f"{self.split_dir.name}.merged.apk"
 
     def _validate(self) -> list[Path]:
-        if not self.split_dir.exists():
-            raise APKMergeError(f"Split APK directory not found: {self.split_dir}")
-        if not self.split_dir.is_dir():
-            raise APKMergeError(f"Split APK path is not a directory: {self.split_dir}")
+        # One directory pass; scandir reports a missing or non-directory path
+        try:
+            with os.scandir(self.split_dir) as it:
+                apk_files = sorted(
+                    Path(entry.path)
+                    for entry in it
+                    if entry.name.endswith(".apk") and entry.is_file()
+                )
+        except FileNotFoundError:
+            raise APKMergeError(
+                f"Split APK directory not found: {self.split_dir}"
+            ) from None
+        except NotADirectoryError:
+            raise APKMergeError(
+                f"Split APK path is not a directory: {self.split_dir}"
+            ) from None
 
-        apk_files = sorted(self.split_dir.glob("*.apk"))
         if not apk_files:
             raise APKMergeError(
                 f"No APK files found in {self.split_dir}. Did you pull split APKs?"
@@ -33,16 +125,32 @@ class SplitAPKMerger:
 
         return apk_files
 
-    def merge(self) -> Path:
-        """Run APKEditor merge workflow and return merged APK path."""
+    def merge(self, fast: bool = False) -> Path:
+        """Merge the split APKs and return the merged APK path.
 
-        self._validate()
-        require("APKEditor")
+        APKEditor merges resource tables and rewrites the manifest. With
+        fast=True, bundles that need neither are merged in-process instead:
+        entries are copied raw, without recompression, base.apk first, and
+        stored entries realigned as `zipalign -P 16 4` would. That only
+        applies when no config split has a resource table (e.g. ABI-only
+        splits) and the base manifest carries no split requirements or
+        Play splits meta-data, since the manifest is copied unchanged.
+        Anything else still goes through APKEditor.
+
+        Args:
+            fast: Try the in-process merge before APKEditor.
+        """
+        apk_files = self._validate()
 
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
         if self.output_path.exists():
             self.output_path.unlink()
 
+        if fast and self._fast_merge(apk_files):
+            return self.output_path
+
+        require("APKEditor")
+
         base_cmd = get_apkeditor_command()
         if base_cmd is None:
             raise APKMergeError(
@@ -71,3 +179,162 @@ class SplitAPKMerger:
             )
 
         return self.output_path
+
+    def _fast_merge(self, apk_files: list[Path]) -> bool:
+        """Merge by stream-copying raw ZIP entries, if the bundle allows it.
+
+        Returns:
+            True if the merged APK was written, False if APKEditor is needed.
+        """
+        base = self.split_dir / "base.apk"
+        if base not in apk_files:
+            return False
+        ordered = [base] + [apk for apk in apk_files if apk != base]
+
+        try:
+            archives = [ZipFile(apk) for apk in ordered]
+        except _ARCHIVE_ERRORS:
+            return False
+
+        try:
+            base_zip, *splits = archives
+            if any("resources.arsc" in split.NameToInfo for split in splits):
+                return False
+            try:
+                manifest = base_zip.read("AndroidManifest.xml")
+            except KeyError:
+                return False
+            if _mentions_split_attributes(manifest):
+                return False
+
+            # Base entries win; splits only contribute entries it lacks
+            entries: dict[str, tuple[ZipFile, ZipInfo]] = {}
+            for archive in archives:
+                for info in archive.infolist():
+                    name = info.filename
+                    if name in entries or _is_signature_file(name):
+                        continue
+                    if archive is not base_zip and name == "AndroidManifest.xml":
+                        continue
+                    entries[name] = (archive, info)
+
+            if len(entries) > _ZIP_MAX_ENTRIES:
+                return False
+
+            staging = self.output_path.with_name(
+                f".{self.output_path.name}.{os.getpid()}.tmp"
+            )
+            try:
+                with staging.open("wb") as out:
+                    if not self._write_entries(out, entries.values()):
+                        return False
+                staging.replace(self.output_path)
+            finally:
+                staging.unlink(missing_ok=True)
+        except _ARCHIVE_ERRORS as exc:
+            raise APKMergeError(f"In-process merge failed: {exc}") from exc
+        finally:
+            for archive in archives:
+                archive.close()
+
+        return True
+
+    @staticmethod
+    def _write_entries(
+        out: BinaryIO, entries: Iterable[tuple[ZipFile, ZipInfo]]
+    ) -> bool:
+        """Write entries' raw data plus a central directory to out.
+
+        Returns:
+            False if the result would need ZIP64.
+        """
+        central: list[bytes] = []
+        for archive, info in entries:
+            offset = out.tell()
+            if info.compress_size > _ZIP_MAX_SIZE or offset > _ZIP_MAX_SIZE:
+                return False
+
+            name = info.filename.encode("utf-8" if info.flag_bits & 0x800 else "cp437")
+            flags = info.flag_bits & _KEPT_FLAGS
+            time, date = _dos_datetime(info)
+            extra = _alignment_extra(offset + _LOCAL_HEADER.size + len(name), info)
+
+            out.write(
+                _LOCAL_HEADER.pack(
+                    _LOCAL_SIGNATURE,
+                    _ZIP_VERSION,
+                    flags,
+                    info.compress_type,
+                    time,
+                    date,
+                    info.CRC,
+                    info.compress_size,
+                    info.file_size,
+                    len(name),
+                    len(extra),
+                )
+            )
+            out.write(name)
+            out.write(extra)
+
+            # Skip the source's local header to reach the raw entry data
+            src = archive.fp
+            if src is None:
+                raise OSError(f"Archive closed: {archive.filename}")
+            src.seek(info.header_offset)
+            header = src.read(_LOCAL_HEADER.size)
+            if len(header) < _LOCAL_HEADER.size or header[:4] != _LOCAL_SIGNATURE:
+                raise BadZipFile(f"Bad local header for {info.filename}")
+            name_len, extra_len = _LOCAL_HEADER.unpack(header)[-2:]
+            src.seek(name_len + extra_len, os.SEEK_CUR)
+
+            remaining = info.compress_size
+            while remaining:
+                chunk = src.read(min(remaining, _COPY_CHUNK_SIZE))
+                if not chunk:
+                    raise BadZipFile(f"Truncated data for {info.filename}")
+                out.write(chunk)
+                remaining -= len(chunk)
+
+            central.append(
+                _CENTRAL_HEADER.pack(
+                    b"PK\x01\x02",
+                    _ZIP_VERSION,
+                    _ZIP_VERSION,
+                    flags,
+                    info.compress_type,
+                    time,
+                    date,
+                    info.CRC,
+                    info.compress_size,
+                    info.file_size,
+                    len(name),
+                    0,
+                    0,
+                    0,
+                    info.internal_attr,
+                    info.external_attr,
+                    offset,
+                )
+                + name
+            )
+
+        cd_offset = out.tell()
+        if cd_offset > _ZIP_MAX_SIZE:
+            return False
+        for record in central:
+            out.write(record)
+        cd_size = out.tell() - cd_offset
+        out.write(
+            _END_RECORD.pack(
+                b"PK\x05\x06",
+                0,
+                0,
+                len(central),
+                len(central),
+                cd_size,
+                cd_offset,
+                0,
+            )
+        )
+        return True
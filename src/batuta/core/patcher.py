@@ -1,11 +1,21 @@
 """APK patching: build, align, and sign APKs from apktool directories."""
 
+import contextlib
+import os
+import shutil
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import ClassVar
 
 from batuta.exceptions import APKAlignError, APKBuildError, APKSignError
 from batuta.models.apk import PatchResult
-from batuta.utils.android_sdk import get_apksigner, get_zipalign
+from batuta.utils.android_sdk import (
+    get_apksigner,
+    get_zipalign,
+    get_zipalign_page_args,
+)
 from batuta.utils.deps import require
 from batuta.utils.process import run_tool
 
@@ -20,6 +30,10 @@ class APKPatcher:
     DEFAULT_STORE_PASS = "android"
     DEFAULT_KEY_PASS = "android"
 
+    # Debug keystore resolved by the first generate_debug_keystore() call
+    _debug_keystore: ClassVar[Path | None] = None
+    _debug_keystore_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
         self,
         apktool_dir: Path,
@@ -95,10 +109,25 @@ class APKPatcher:
         """
         zipalign = get_zipalign()
 
-        # zipalign -p 4 input.apk output.apk
-        # -p: page-align shared object files
+        # Already aligned (e.g. by newer apktool): link instead of rewriting
+        if self.is_aligned(input_apk):
+            output.unlink(missing_ok=True)
+            try:
+                os.link(input_apk, output)
+            except OSError:
+                shutil.copy2(input_apk, output)
+            return output
+
+        # zipalign -P 16 4 input.apk output.apk
+        # -P 16 / -p: page-align shared object files (16 KiB where supported)
         # 4: 4-byte alignment (required for Android)
-        cmd = [str(zipalign), "-P", "16", "4", str(input_apk), str(output)]
+        cmd = [
+            str(zipalign),
+            *get_zipalign_page_args(),
+            "4",
+            str(input_apk),
+            str(output),
+        ]
 
         try:
             run_tool(cmd, check=True)
@@ -110,6 +139,26 @@ class APKPatcher:
 
         return output
 
+    def is_aligned(self, apk: Path) -> bool:
+        """Check if an APK already meets the alignment align() produces.
+
+        Runs zipalign in check-only mode, which reads the APK but doesn't
+        write a copy.
+
+        Args:
+            apk: APK path to check.
+
+        Returns:
+            True if the APK is aligned; False if not or if the check fails.
+        """
+        zipalign = get_zipalign()
+
+        cmd = [str(zipalign), "-c", *get_zipalign_page_args(), "4", str(apk)]
+
+        with contextlib.suppress(Exception):
+            return run_tool(cmd, check=False).success
+        return False
+
     def sign(
         self,
         input_apk: Path,
@@ -188,12 +237,22 @@ class APKPatcher:
     def generate_debug_keystore(self) -> Path:
         """Generate a debug keystore if it doesn't exist.
 
+        The path is resolved once per process and shared by all patchers;
+        concurrent first calls wait for a single keytool run.
+
         Returns:
             Path to debug keystore.
 
         Raises:
             APKSignError: If keystore generation fails.
         """
+        with APKPatcher._debug_keystore_lock:
+            if APKPatcher._debug_keystore is None:
+                APKPatcher._debug_keystore = self._create_debug_keystore()
+            return APKPatcher._debug_keystore
+
+    def _create_debug_keystore(self) -> Path:
+        """Return the debug keystore path, running keytool if it's missing."""
         require("keytool")
 
         # Create keystore directory if needed
@@ -238,6 +297,10 @@ class APKPatcher:
 
         return keystore_path
 
+    def _resolve_keystore(self, keystore: Path | None) -> Path:
+        """Return keystore, or the debug keystore (generated if needed)."""
+        return keystore if keystore is not None else self.generate_debug_keystore()
+
     def patch(
         self,
         sign: bool = True,
@@ -269,12 +332,23 @@ class APKPatcher:
         """
         self.validate()
 
-        keystore_generated = False
+        keystore_generated = keystore is None and sign
         verified: bool | None = None
 
-        with tempfile.TemporaryDirectory() as tmpdir:
+        # Stage next to the output so the unsigned result can be renamed into
+        # place instead of copied across filesystems
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with (
+            tempfile.TemporaryDirectory(dir=self.output_path.parent) as tmpdir,
+            ThreadPoolExecutor(max_workers=1) as executor,
+        ):
             tmp_path = Path(tmpdir)
 
+            # keytool runs while apktool builds; only signing waits on it
+            if sign:
+                keystore_job = executor.submit(self._resolve_keystore, keystore)
+
             # Step 1: Build
             built_apk = tmp_path / "built.apk"
             self.build(built_apk)
@@ -289,15 +363,10 @@ class APKPatcher:
 
             # Step 3: Sign (if requested)
             if sign:
-                # Get or generate keystore
-                if keystore is None:
-                    keystore = self.generate_debug_keystore()
-                    keystore_generated = True
-
                 self.sign(
                     current_apk,
                     self.output_path,
-                    keystore,
+                    keystore_job.result(),
                     key_alias,
                     keystore_pass,
                     key_pass,
@@ -307,10 +376,8 @@ class APKPatcher:
                 if verify_signature:
                     verified = self.verify(self.output_path)
             else:
-                # No signing, just copy to output
-                import shutil
-
-                shutil.copy2(current_apk, self.output_path)
+                # No signing, just move to output
+                os.replace(current_apk, self.output_path)
 
         return PatchResult(
             source_dir=self.apktool_dir,
@@ -1,5 +1,7 @@
 """Typed exception hierarchy for batuta."""
 
+from batuta.models.apk import PackageInfo
+
 
 class BatutaError(Exception):
     """Base exception for all batuta errors."""
@@ -42,9 +44,19 @@ class PackageNotFoundError(ADBError):
 class MultiplePackagesFoundError(ADBError):
     """Raised when multiple packages match a query and user must choose."""
 
-    def __init__(self, query: str, packages: list[str]):
+    def __init__(
+        self,
+        query: str,
+        packages: list[str],
+        matches: list[PackageInfo] | None = None,
+    ):
         self.query = query
         self.packages = packages
+        # Matching packages from the search that raised, so callers can offer
+        # a selection without searching the device again.
+        self.matches = matches or [
+            PackageInfo.model_construct(package_name=p) for p in packages
+        ]
         super().__init__(
             f"Multiple packages match '{query}': {len(packages)} found. "
             "Use --select to choose interactively or provide a more specific query."
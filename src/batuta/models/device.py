@@ -1,8 +1,9 @@
 """Pydantic models for Android devices."""
 
 from enum import StrEnum
+from functools import cached_property
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class DeviceState(StrEnum):
@@ -47,21 +48,32 @@ class Device(BaseModel):
 
 
 class DeviceList(BaseModel):
-    """List of connected devices."""
+    """List of connected devices.
 
-    devices: list[Device]
+    Snapshots are shared between callers (see ADBWrapper.list_devices), so the
+    model is frozen and holds a tuple; its derived views are computed once.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    devices: tuple[Device, ...]
 
     def __len__(self) -> int:
         return len(self.devices)
 
-    @property
+    @cached_property
     def available(self) -> list[Device]:
         """Get devices that are available for commands."""
         return [d for d in self.devices if d.is_available]
 
+    @cached_property
+    def _by_id(self) -> dict[str, Device]:
+        # First occurrence wins, matching the former linear scan
+        index: dict[str, Device] = {}
+        for device in self.devices:
+            index.setdefault(device.id, device)
+        return index
+
     def get_by_id(self, device_id: str) -> Device | None:
         """Find a device by its ID."""
-        for device in self.devices:
-            if device.id == device_id:
-                return device
-        return None
+        return self._by_id.get(device_id)
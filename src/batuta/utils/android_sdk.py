@@ -2,13 +2,43 @@
 
 import os
 import platform
+from functools import lru_cache
 from pathlib import Path
 
 from batuta.exceptions import ToolNotFoundError
 
+# Host facts used for SDK discovery, resolved once at import
+_SYSTEM = platform.system()
+_HOME = Path.home()
 
+
+def _sdk_candidates() -> tuple[str, ...]:
+    """Common SDK install locations for this OS, most likely first."""
+    if _SYSTEM == "Darwin":  # macOS
+        return (
+            str(_HOME / "Library" / "Android" / "sdk"),
+            "/opt/android-sdk",
+        )
+    if _SYSTEM == "Linux":
+        return (
+            str(_HOME / "Android" / "Sdk"),
+            str(_HOME / "android-sdk"),
+            "/opt/android-sdk",
+        )
+    if _SYSTEM == "Windows":
+        return (
+            str(_HOME / "AppData" / "Local" / "Android" / "Sdk"),
+            "C:/Android/sdk",
+        )
+    return ()
+
+
+_SDK_CANDIDATES = _sdk_candidates()
+
+
+@lru_cache(maxsize=1)
 def get_android_home() -> Path | None:
-    """Get Android SDK root directory.
+    """Get Android SDK root directory (cached).
 
     Checks environment variables and common installation locations.
 
@@ -21,36 +51,16 @@ def get_android_home() -> Path | None:
             if path.is_dir():
                 return path
 
-    system = platform.system()
-    home = Path.home()
-
-    common_locations: list[Path] = []
-    if system == "Darwin":  # macOS
-        common_locations = [
-            home / "Library" / "Android" / "sdk",
-            Path("/opt/android-sdk"),
-        ]
-    elif system == "Linux":
-        common_locations = [
-            home / "Android" / "Sdk",
-            home / "android-sdk",
-            Path("/opt/android-sdk"),
-        ]
-    elif system == "Windows":
-        common_locations = [
-            home / "AppData" / "Local" / "Android" / "Sdk",
-            Path("C:/Android/sdk"),
-        ]
-
-    for location in common_locations:
-        if location.is_dir():
-            return location
+    for location in _SDK_CANDIDATES:
+        if os.path.isdir(location):
+            return Path(location)
 
     return None
 
 
+@lru_cache(maxsize=4)
 def get_build_tools_path(min_version: str = "30.0.0") -> Path:
-    """Get the latest Android build-tools directory.
+    """Get the latest Android build-tools directory (cached per min_version).
 
     Args:
         min_version: Minimum required version (e.g., "30.0.0").
@@ -69,40 +79,44 @@ def get_build_tools_path(min_version: str = "30.0.0") -> Path:
         )
 
     build_tools_dir = android_home / "build-tools"
-    if not build_tools_dir.is_dir():
+
+    # Track the newest qualifying version directory in a single pass
+    best: tuple[tuple[int, ...], str] | None = None
+    min_version_tuple = tuple(int(x) for x in min_version.split("."))
+
+    # scandir's cached entry type saves a stat() per entry
+    try:
+        with os.scandir(build_tools_dir) as it:
+            for entry in it:
+                try:
+                    version_tuple = tuple(int(x) for x in entry.name.split("."))
+                except ValueError:
+                    # Skip non-version directories
+                    continue
+                if version_tuple < min_version_tuple:
+                    continue
+                if best is not None and version_tuple <= best[0]:
+                    continue
+                if entry.is_dir():
+                    best = (version_tuple, entry.path)
+    except OSError:
         raise ToolNotFoundError(
             "Android build-tools",
             f"Install build-tools via Android SDK Manager in {android_home}",
-        )
+        ) from None
 
-    # Find all version directories and sort them
-    versions: list[tuple[tuple[int, ...], Path]] = []
-    min_version_tuple = tuple(int(x) for x in min_version.split("."))
-
-    for version_dir in build_tools_dir.iterdir():
-        if not version_dir.is_dir():
-            continue
-        try:
-            version_tuple = tuple(int(x) for x in version_dir.name.split("."))
-            if version_tuple >= min_version_tuple:
-                versions.append((version_tuple, version_dir))
-        except ValueError:
-            # Skip non-version directories
-            continue
-
-    if not versions:
+    if best is None:
         raise ToolNotFoundError(
             f"Android build-tools >= {min_version}",
             f"Install build-tools via Android SDK Manager in {android_home}",
         )
 
-    # Return the latest version
-    versions.sort(reverse=True)
-    return versions[0][1]
+    return Path(best[1])
 
 
+@lru_cache(maxsize=1)
 def get_zipalign() -> Path:
-    """Get path to zipalign binary.
+    """Get path to zipalign binary (cached).
 
     Returns:
         Path to zipalign executable.
@@ -114,7 +128,7 @@ def get_zipalign() -> Path:
     zipalign = build_tools / "zipalign"
 
     # On Windows, add .exe extension
-    if platform.system() == "Windows":
+    if _SYSTEM == "Windows":
         zipalign = build_tools / "zipalign.exe"
 
     if not zipalign.is_file():
@@ -126,8 +140,30 @@ def get_zipalign() -> Path:
     return zipalign
 
 
+@lru_cache(maxsize=1)
+def get_zipalign_page_args() -> tuple[str, ...]:
+    """Get zipalign's flags for page-aligning shared objects (cached).
+
+    `-P 16` (16 KiB pages) was added in build-tools 35 and older zipalign
+    rejects it, so those fall back to `-p` (4 KiB pages).
+
+    Returns:
+        ("-P", "16") or ("-p",), depending on the build-tools version.
+
+    Raises:
+        ToolNotFoundError: If zipalign not found.
+    """
+    build_tools = get_zipalign().parent
+    try:
+        major = int(build_tools.name.split(".")[0])
+    except ValueError:
+        return ("-p",)
+    return ("-P", "16") if major >= 35 else ("-p",)
+
+
+@lru_cache(maxsize=1)
 def get_apksigner() -> Path:
-    """Get path to apksigner binary.
+    """Get path to apksigner binary (cached).
 
     Returns:
         Path to apksigner executable.
@@ -138,7 +174,7 @@ def get_apksigner() -> Path:
     build_tools = get_build_tools_path()
 
     # apksigner is a wrapper script (jar on all platforms)
-    if platform.system() == "Windows":
+    if _SYSTEM == "Windows":
         apksigner = build_tools / "apksigner.bat"
     else:
         apksigner = build_tools / "apksigner"
@@ -1,5 +1,8 @@
 """APK file validation utilities."""
 
+import os
+import stat
+import struct
 from pathlib import Path
 
 from batuta.exceptions import BatutaError
@@ -7,11 +10,27 @@ from batuta.exceptions import BatutaError
 # ZIP file magic header (APKs are ZIP files)
 ZIP_FILE_HEADER = b"PK\x03\x04"
 
+# ZIP End of Central Directory signature. The record (22 bytes plus a comment
+# of up to 64 KiB) ends every complete archive, so truncated files lack it.
+ZIP_EOCD_SIGNATURE = b"PK\x05\x06"
+ZIP_EOCD_MAX_SIZE = 22 + 0xFFFF
+
+# EOCD fields after the signature: disk numbers, entry counts, central
+# directory size and offset, comment length
+_EOCD = struct.Struct("<4s4H2LH")
+# Central directory header: signature, then flags at offset 8 and the file
+# name / extra field / comment lengths at offsets 28-33 (46 bytes in total)
+_CD_HEADER = struct.Struct("<4s4xH18x3H12x")
+_CD_SIGNATURE = b"PK\x01\x02"
+# General purpose flag bit 11: file name is UTF-8 (otherwise CP437)
+_UTF8_FLAG = 0x800
+
 
 def validate_apk_path(
     apk_path: Path,
     *,
     require_zip_header: bool = False,
+    require_zip_trailer: bool = False,
     error_cls: type[BatutaError] = BatutaError,
 ) -> None:
     """Validate that an APK file path is valid.
@@ -21,31 +40,49 @@ def validate_apk_path(
     - Path is a file (not a directory)
     - File has .apk extension
     - Optionally: file starts with ZIP magic header
+    - Optionally: file ends with a ZIP End of Central Directory record
 
     Args:
         apk_path: Path to the APK file to validate.
         require_zip_header: If True, also verify the file starts with ZIP header.
+        require_zip_trailer: If True, also verify the archive isn't truncated
+            (only the last ~64 KiB are read).
         error_cls: Exception class to raise on validation failure.
 
     Raises:
         BatutaError (or subclass): If validation fails.
     """
-    if not apk_path.exists():
-        raise error_cls(f"APK not found: {apk_path}")
+    # One stat() answers both "exists" and "is a regular file"
+    try:
+        st = os.stat(apk_path)
+    except OSError:
+        raise error_cls(f"APK not found: {apk_path}") from None
 
-    if not apk_path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         raise error_cls(f"Not a file: {apk_path}")
 
-    if apk_path.suffix.lower() != ".apk":
+    if not apk_path.name.lower().endswith(".apk") or apk_path.name == ".apk":
         raise error_cls(f"Not an APK file (expected .apk extension): {apk_path}")
 
-    if require_zip_header:
+    if not (require_zip_header or require_zip_trailer):
+        return
+
+    # Raw descriptor reads: no buffered file object for a few small reads
+    try:
+        fd = os.open(apk_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
         try:
-            with apk_path.open("rb") as f:
-                header = f.read(4)
-        except OSError as e:
-            raise error_cls(f"Failed to read APK header: {e}") from e
+            header = os.read(fd, len(ZIP_FILE_HEADER))
+            tail = b""
+            if require_zip_trailer:
+                size = os.lseek(fd, 0, os.SEEK_END)
+                start = os.lseek(fd, max(0, size - ZIP_EOCD_MAX_SIZE), os.SEEK_SET)
+                tail = os.read(fd, size - start)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        raise error_cls(f"Failed to read APK header: {e}") from e
 
+    if require_zip_header:
         if len(header) < len(ZIP_FILE_HEADER):
             raise error_cls("File is too small to be a valid APK")
 
@@ -53,3 +90,58 @@ def validate_apk_path(
             raise error_cls(
                 f"Header mismatch. Expected: {ZIP_FILE_HEADER!r}, got: {header!r}"
             )
+
+    if require_zip_trailer and ZIP_EOCD_SIGNATURE not in tail:
+        raise error_cls("APK is truncated (no ZIP end of central directory record)")
+
+
+def read_entry_names(apk_path: Path) -> list[str] | None:
+    """Read the entry names of an APK straight from its central directory.
+
+    Only the file name of each central directory record is decoded, which is
+    much cheaper than ZipFile building a full ZipInfo per entry. Returns
+    None when the archive can't be handled this way (no EOCD record, ZIP64,
+    or an inconsistent directory), so callers can fall back to ZipFile.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with apk_path.open("rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        f.seek(max(0, size - ZIP_EOCD_MAX_SIZE))
+        tail_start = f.tell()
+        tail = f.read()
+
+        eocd = tail.rfind(ZIP_EOCD_SIGNATURE)
+        if eocd == -1 or len(tail) - eocd < _EOCD.size:
+            return None
+        _, _, _, _, count, cd_size, cd_offset, _ = _EOCD.unpack_from(tail, eocd)
+        if count == 0xFFFF or cd_size == 0xFFFFFFFF or cd_offset == 0xFFFFFFFF:
+            return None  # ZIP64
+
+        # The directory ends where the EOCD starts (this also copes with data
+        # prepended to the archive, which shifts every recorded offset)
+        cd_start = tail_start + eocd - cd_size
+        if cd_start < 0:
+            return None
+        f.seek(cd_start)
+        directory = f.read(cd_size)
+
+    header_size = _CD_HEADER.size
+    names: list[str] = []
+    pos = 0
+    for _ in range(count):
+        if len(directory) - pos < header_size:
+            return None
+        signature, flags, name_len, extra_len, comment_len = _CD_HEADER.unpack_from(
+            directory, pos
+        )
+        if signature != _CD_SIGNATURE:
+            return None
+
+        start = pos + header_size
+        raw = directory[start : start + name_len]
+        names.append(raw.decode("utf-8" if flags & _UTF8_FLAG else "cp437"))
+        pos = start + name_len + extra_len + comment_len
+
+    return names
@@ -7,6 +7,13 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # optional dependency, see the "fast" extra
+    _HAS_ORJSON = False
+
 CONFIG_DIR = Path.home() / ".batuta"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 
@@ -15,17 +22,19 @@ CONFIG_FILE = CONFIG_DIR / "config.json"
 def load_config() -> dict[str, Any]:
     """Load configuration data from disk (cached)."""
 
-    if not CONFIG_FILE.exists():
-        return {}
-
+    # A missing file is just another OSError; json accepts UTF-8 bytes as-is
     try:
-        raw = CONFIG_FILE.read_text()
+        raw = CONFIG_FILE.read_bytes()
     except OSError:
         return {}
 
+    # Only a JSON object is a usable config; skip the parser for anything else
+    if not raw.lstrip().startswith(b"{"):
+        return {}
+
     try:
-        data = json.loads(raw)
-    except ValueError:
+        data = orjson.loads(raw) if _HAS_ORJSON else json.loads(raw)
+    except ValueError:  # includes orjson.JSONDecodeError
         return {}
 
     if isinstance(data, dict):
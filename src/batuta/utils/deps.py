@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 import shutil
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Final
 
@@ -29,13 +30,20 @@ APKEDITOR_CONFIG_KEY: Final[str] = "apkeditor_path"
 APKEDITOR_JAR_NAME: Final[str] = "APKEditor.jar"
 
 
+@cache
+def _which(tool: str) -> str | None:
+    """Resolve a tool on PATH (cached per process)."""
+
+    return shutil.which(tool)
+
+
 def check_tool(tool: str) -> bool:
     """Check if a tool is available on PATH or via configuration."""
 
     if tool == "APKEditor":
         return get_apkeditor_command() is not None
 
-    return shutil.which(tool) is not None
+    return _which(tool) is not None
 
 
 def require(*tools: str) -> None:
@@ -64,7 +72,7 @@ def get_tool_path(tool: str) -> str:
     Raises:
         ToolNotFoundError: If the tool is not found.
     """
-    path = shutil.which(tool)
+    path = _which(tool)
     if path is None:
         raise ToolNotFoundError(tool, TOOL_INSTALL_HINTS.get(tool))
     return path
@@ -89,16 +97,22 @@ def _resolve_jar_path(raw_value: str | None) -> Path | None:
 def get_apkeditor_command() -> list[str] | None:
     """Resolve the APKEditor command via env/config/PATH."""
 
+    command = _apkeditor_command()
+    return list(command) if command is not None else None
+
+
+@lru_cache(maxsize=1)
+def _apkeditor_command() -> tuple[str, ...] | None:
     jar_path = _resolve_jar_path(os.environ.get(APKEDITOR_ENV_VAR))
     if jar_path is None:
         cfg_value = get_config_value(APKEDITOR_CONFIG_KEY)
         jar_path = _resolve_jar_path(cfg_value if isinstance(cfg_value, str) else None)
 
     if jar_path is not None:
-        return ["java", "-jar", str(jar_path)]
+        return ("java", "-jar", str(jar_path))
 
-    wrapper = shutil.which("APKEditor")
+    wrapper = _which("APKEditor")
     if wrapper:
-        return [wrapper]
+        return (wrapper,)
 
     return None
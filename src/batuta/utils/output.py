@@ -1,10 +1,47 @@
 """Rich console helpers for terminal output."""
 
+import json
+import sys
+from collections.abc import Iterable
+from contextlib import AbstractContextManager, nullcontext
 from typing import Any
 
 from rich.console import Console as RichConsole
 from rich.status import Status
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # optional dependency, see the "fast" extra
+    _HAS_ORJSON = False
+
+# Flush threshold (in characters) for Console.write_lines()
+WRITE_CHUNK_SIZE = 4096
+
+
+def dump_json(data: Any) -> bytes:
+    """Serialize data as indented JSON (UTF-8 bytes).
+
+    Uses orjson when it is installed and falls back to the standard library
+    encoder otherwise. Both produce the same two-space indented layout.
+    Values neither encoder knows (e.g. Path) are serialized with str().
+    """
+    if _HAS_ORJSON:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False, default=str).encode()
+
+
+def emit_json(data: Any) -> None:
+    """Write data to stdout as indented JSON, bypassing the text layer."""
+    emit_json_bytes(dump_json(data))
+
+
+def emit_json_bytes(payload: bytes) -> None:
+    """Write an already-encoded JSON document (e.g. model_dump_json) to stdout."""
+    sys.stdout.buffer.write(payload + b"\n")
+    sys.stdout.buffer.flush()
+
 
 class Console:
     """Wrapper around rich.Console with convenience methods."""
@@ -22,6 +59,34 @@ class Console:
         """Check if JSON mode is enabled."""
         return self._json_mode
 
+    @property
+    def is_terminal(self) -> bool:
+        """Check if output goes to an interactive terminal."""
+        return self._console.is_terminal
+
+    def write_lines(self, lines: Iterable[str]) -> None:
+        """Write plain text lines, bypassing Rich (suppressed in JSON mode).
+
+        Lines are flushed in ~4 KiB chunks, so large listings stream to the
+        reader without building a render tree first.
+        """
+        if self._json_mode:
+            return
+
+        file = self._console.file
+        chunk: list[str] = []
+        size = 0
+        for line in lines:
+            chunk.append(line)
+            size += len(line) + 1
+            if size >= WRITE_CHUNK_SIZE:
+                file.write("\n".join(chunk) + "\n")
+                chunk.clear()
+                size = 0
+        if chunk:
+            file.write("\n".join(chunk) + "\n")
+        file.flush()
+
     def print(self, *args: Any, **kwargs: Any) -> None:
         """Print to console (suppressed in JSON mode)."""
         if not self._json_mode:
@@ -47,8 +112,14 @@ class Console:
         if not self._json_mode:
             self._console.print(f"[yellow]⚠[/yellow] {message}")
 
-    def status(self, message: str) -> Status:
-        """Create a status spinner context manager."""
+    def status(self, message: str) -> AbstractContextManager[Status | None]:
+        """Create a status spinner context manager.
+
+        The spinner is skipped in JSON mode and when output is not a terminal,
+        so scripted runs don't start Rich's refresh thread or emit escapes.
+        """
+        if self._json_mode or not self._console.is_terminal:
+            return nullcontext()
         return self._console.status(message)
 
 
@@ -1,12 +1,19 @@
 """Subprocess wrapper for all external tool invocations."""
 
+import contextlib
+import secrets
 import subprocess
+import threading
+from collections import deque
+from collections.abc import Generator
 from dataclasses import dataclass
+from types import TracebackType
+from typing import Self
 
 from batuta.exceptions import ProcessError
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessResult:
     """Result of a subprocess execution."""
 
@@ -75,3 +82,212 @@ def run_tool(
         raise ProcessError(command, result.returncode, result.stderr)
 
     return proc_result
+
+
+def stream_tool(command: list[str], *, check: bool = True) -> Generator[str]:
+    """Run an external tool and yield its non-empty stdout lines as they arrive.
+
+    If the caller stops iterating early, the process is killed instead of
+    being waited on, so parsers that only need the start of a large output
+    never read (or buffer) the rest.
+
+    Args:
+        command: Command and arguments to run.
+        check: If True, raise ProcessError on non-zero exit once the output
+            has been fully consumed.
+
+    Yields:
+        Output lines without trailing newlines.
+
+    Raises:
+        ProcessError: If the command is not found, or if check=True and the
+            command returns non-zero.
+    """
+    try:
+        proc = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+    except FileNotFoundError as e:
+        raise ProcessError(command, -1, f"Command not found: {command[0]}") from e
+
+    assert proc.stdout is not None and proc.stderr is not None
+    completed = False
+    stderr = ""
+    try:
+        for line in proc.stdout:
+            line = line.rstrip("\n")
+            if line:
+                yield line
+        completed = True
+        stderr = proc.stderr.read()
+    finally:
+        if not completed:
+            proc.kill()
+        proc.stdout.close()
+        proc.stderr.close()
+        proc.wait()
+
+    if check and proc.returncode != 0:
+        raise ProcessError(command, proc.returncode, stderr)
+
+
+class ShellSession:
+    """Long-lived shell process that runs commands written to its stdin.
+
+    Saves a process launch (and, for `adb shell`, a device connection) per
+    command. Each command is followed by an echo of a per-session marker and
+    its exit status, which delimits its output. stderr is merged into stdout
+    on the shell side (2>&1), and stdin is redirected from /dev/null so a
+    command can't swallow the ones written after it.
+
+    The shell must not echo its input (no PTY): an echoed command line
+    would contain the marker. What the launching process itself writes to
+    stderr (e.g. adb's "device offline") is kept and reported if the
+    session dies.
+
+    A session runs one command at a time and is not thread-safe.
+    """
+
+    # Lines of output kept for the ProcessError message of a failed command
+    ERROR_CONTEXT_LINES = 20
+
+    def __init__(self, command: list[str]) -> None:
+        """Start the shell.
+
+        Args:
+            command: Command that starts an interactive shell.
+
+        Raises:
+            ProcessError: If the command is not found.
+        """
+        self.command = command
+        self._marker = f"__BATUTA_EOF_{secrets.token_hex(4)}_"
+        try:
+            self._proc = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1,
+            )
+        except FileNotFoundError as e:
+            raise ProcessError(command, -1, f"Command not found: {command[0]}") from e
+
+        # Drained on a thread so a chatty stderr can never block the shell
+        self._stderr: deque[str] = deque(maxlen=self.ERROR_CONTEXT_LINES)
+        self._stderr_reader = threading.Thread(target=self._read_stderr, daemon=True)
+        self._stderr_reader.start()
+
+    def _read_stderr(self) -> None:
+        assert self._proc.stderr is not None
+        for line in self._proc.stderr:
+            if line := line.rstrip():
+                self._stderr.append(line)
+
+    def _closed_error(self, command: list[str]) -> ProcessError:
+        """Build the error for a session whose shell has exited."""
+        with contextlib.suppress(subprocess.TimeoutExpired):
+            self._proc.wait(timeout=2)
+        self._stderr_reader.join(timeout=1)
+        returncode = self._proc.returncode
+        return ProcessError(
+            command,
+            returncode if returncode is not None else -1,
+            "\n".join(self._stderr) or "Shell session closed",
+        )
+
+    @property
+    def alive(self) -> bool:
+        """Check if the shell process is still running."""
+        return self._proc.poll() is None
+
+    def run(self, command: str, *, check: bool = True) -> list[str]:
+        """Run a shell command and return its non-empty output lines.
+
+        Raises:
+            ProcessError: If the session died, or if check=True and the
+                command returns non-zero.
+        """
+        return list(self.stream(command, check=check))
+
+    def stream(self, command: str, *, check: bool = True) -> Generator[str]:
+        """Run a shell command and yield its non-empty output lines.
+
+        If the caller stops iterating early, the rest of the output is read
+        and discarded when the generator is closed, keeping the session in
+        sync for the next command. Close it explicitly (e.g. with
+        contextlib.closing) before running another command.
+
+        Raises:
+            ProcessError: If the session died, or if check=True and the
+                command returns non-zero once its output was fully consumed.
+        """
+        assert self._proc.stdin is not None and self._proc.stdout is not None
+        stdout = self._proc.stdout
+        full_command = [*self.command, command]
+
+        try:
+            self._proc.stdin.write(
+                f"{{ {command}\n}} </dev/null 2>&1; echo {self._marker}$?\n"
+            )
+            self._proc.stdin.flush()
+        except OSError as e:
+            raise self._closed_error(full_command) from e
+
+        returncode: int | None = None
+        recent: deque[str] = deque(maxlen=self.ERROR_CONTEXT_LINES)
+        try:
+            while returncode is None:
+                line = stdout.readline()
+                if not line:
+                    raise self._closed_error(full_command)
+
+                # Output without a trailing newline ends up before the marker
+                output, marker, status = line.rstrip("\r\n").partition(self._marker)
+                if marker:
+                    returncode = int(status) if status.isdigit() else -1
+                if output:
+                    recent.append(output)
+                    yield output
+        finally:
+            while returncode is None:
+                line = stdout.readline()
+                if not line:
+                    break
+                _, marker, status = line.rstrip("\r\n").partition(self._marker)
+                if marker:
+                    returncode = int(status) if status.isdigit() else -1
+
+        if returncode is None:
+            raise self._closed_error(full_command)
+        if check and returncode != 0:
+            raise ProcessError(full_command, returncode, "\n".join(recent))
+
+    def close(self) -> None:
+        """End the shell, killing it if it doesn't exit promptly."""
+        if self._proc.stdin is not None:
+            with contextlib.suppress(OSError):
+                self._proc.stdin.close()
+        try:
+            self._proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+        if self._proc.stdout is not None:
+            self._proc.stdout.close()
+        self._stderr_reader.join(timeout=1)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()